@@ -0,0 +1,26 @@
+"""
+Entry point for opensearch-keeper.
+"""
+
+import sys
+
+
+def main() -> None:
+    """Run the command-line interface.
+
+    A bare ``--version`` is answered before the CLI (and Typer) is imported.
+    """
+    if sys.argv[1:] in (["--version"], ["-V"]):
+        from opensearch_keeper import __version__
+
+        print(f"opensearch-keeper {__version__}")
+        return
+
+    from opensearch_keeper.cli import app, register_subcommands
+
+    register_subcommands(sys.argv[1:])
+    app()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,75 +2,145 @@
 Authentication module for OpenSearch connections.
 """
 
+import functools
 import logging
-from typing import Dict, Any
+import socket
+import threading
+from typing import Dict, Any, Tuple
 
-import boto3
-from opensearchpy import RequestsHttpConnection
+from opensearchpy import OpenSearch, RequestsHttpConnection
+from opensearchpy.exceptions import SerializationError
+from opensearchpy.serializer import JSONSerializer
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.connection import HTTPConnection
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
 
 logger = logging.getLogger(__name__)
 
+# Default number of pooled connections kept per host
+DEFAULT_POOL_MAXSIZE = 20
+
+# Enable TCP keep-alive so idle pooled connections are not silently dropped
+KEEPALIVE_SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+]
+for _option, _value in (("TCP_KEEPIDLE", 60), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 6)):
+    if hasattr(socket, _option):
+        KEEPALIVE_SOCKET_OPTIONS.append((socket.IPPROTO_TCP, getattr(socket, _option), _value))
+
+
+class KeepAliveHTTPAdapter(HTTPAdapter):
+    """HTTP adapter that enables TCP keep-alive on pooled sockets."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        """Initialize the pool manager with keep-alive socket options.
+
+        :param args: Additional arguments for HTTPAdapter.init_poolmanager.
+        :param kwargs: Additional keyword arguments for HTTPAdapter.init_poolmanager.
+        """
+        kwargs.setdefault("socket_options", KEEPALIVE_SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **kwargs)
+
+
+class KeepAliveRequestsHttpConnection(RequestsHttpConnection):
+    """Connection class with a sized connection pool and TCP keep-alive."""
+
+    def __init__(self, *args, pool_maxsize: int = DEFAULT_POOL_MAXSIZE, **kwargs):
+        """Initialize the connection.
+
+        :param args: Additional arguments for RequestsHttpConnection.
+        :param pool_maxsize: Maximum number of pooled connections per host.
+        :param kwargs: Additional keyword arguments for RequestsHttpConnection.
+        """
+        super().__init__(*args, **kwargs)
+        self.session.headers["Connection"] = "keep-alive"
+        adapter = KeepAliveHTTPAdapter(pool_maxsize=pool_maxsize)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+
+def build_proxy_url(proxy_config: Dict[str, Any]) -> str:
+    """Build a SOCKS5 proxy URL from a proxy configuration.
 
-class ProxiedRequestsHttpConnection(RequestsHttpConnection):
+    :param proxy_config: Dictionary with proxy configuration.
+    :return: Proxy URL.
+    """
+    host, port, username, password = (
+        proxy_config.get(key) for key in ("host", "port", "username", "password")
+    )
+    credentials = f"{username}:{password}@" if username and password else ""
+    return f"socks5://{credentials}{host}:{port}"
+
+
+class ProxiedRequestsHttpConnection(KeepAliveRequestsHttpConnection):
     """Custom connection class that supports SOCKS proxy."""
 
     def __init__(self, proxy_config: Dict[str, Any], *args, **kwargs):
         """Initialize the proxied connection.
 
+        The proxy settings are applied to the session once, so every request
+        goes through the same pooled proxied connections.
+
         :param proxy_config: Dictionary with proxy configuration.
-        :param args: Additional arguments for RequestsHttpConnection.
-        :param kwargs: Additional keyword arguments for RequestsHttpConnection.
+        :param args: Additional arguments for KeepAliveRequestsHttpConnection.
+        :param kwargs: Additional keyword arguments for KeepAliveRequestsHttpConnection.
         """
         super().__init__(*args, **kwargs)
         self.proxy_config = proxy_config
 
-    def perform_request(
-        self,
-        method,
-        url,
-        params=None,
-        body=None,
-        timeout=None,
-        allow_redirects=True,
-        ignore=(),
-        headers=None,
-    ):
-        """Perform the request through a proxy.
-
-        :param method: HTTP method.
-        :param url: URL to request.
-        :param params: Query parameters.
-        :param body: Request body.
-        :param timeout: Request timeout.
-        :param allow_redirects: Allow redirects.
-        :param ignore: Status codes to ignore.
-        :param headers: Request headers.
-        :return: Response from the server.
-        """
-        proxy_host = self.proxy_config.get("host")
-        proxy_port = self.proxy_config.get("port")
-        proxy_username = self.proxy_config.get("username")
-        proxy_password = self.proxy_config.get("password")
-
-        proxy_url = f"socks5://{proxy_host}:{proxy_port}"
-        if proxy_username and proxy_password:
-            proxy_url = f"socks5://{proxy_username}:{proxy_password}@{proxy_host}:{proxy_port}"
-
-        proxies = {
+        proxy_url = build_proxy_url(proxy_config)
+        self.session.proxies = {
             "http": proxy_url,
             "https": proxy_url,
         }
 
-        self.session.proxies = proxies
-        return super().perform_request(
-            method, url, params, body, timeout, allow_redirects, ignore, headers
-        )
 
+@functools.lru_cache(maxsize=None)
+def get_proxied_connection_class(proxy_items: Tuple[Tuple[str, Any], ...]) -> type:
+    """Get a connection class bound to a proxy configuration.
+
+    The class is cached per proxy configuration, so every client for the same
+    proxy shares one connection class instead of a fresh factory per call.
+
+    :param proxy_items: Proxy configuration as a sorted tuple of key/value pairs.
+    :return: Connection class with the proxy configuration bound.
+    """
+    proxy_config = dict(proxy_items)
+
+    class BoundProxiedRequestsHttpConnection(ProxiedRequestsHttpConnection):
+        def __init__(self, *args, **kwargs):
+            super().__init__(proxy_config, *args, **kwargs)
+
+    return BoundProxiedRequestsHttpConnection
+
+
+@functools.lru_cache(maxsize=None)
+def _get_aws_credentials() -> Any:
+    """Resolve AWS credentials once per process.
+
+    The returned credentials object refreshes itself when it nears expiry,
+    so it is safe to share between all signers.
 
+    :return: AWS credentials object.
+    """
+    import boto3
+
+    return boto3.Session().get_credentials()
+
+
+@functools.lru_cache(maxsize=None)
 def create_aws_auth(region: str, service: str = "es") -> Any:
     """Create AWS SigV4 authentication for OpenSearch.
 
+    The result is cached per (region, service) pair.
+
     :param region: AWS region.
     :param service: AWS service name (default: 'es').
     :return: AWS authentication object.
@@ -78,7 +148,7 @@ def create_aws_auth(region: str, service: str = "es") -> Any:
     try:
         from opensearchpy import AWSV4SignerAuth
 
-        credentials = boto3.Session().get_credentials()
+        credentials = _get_aws_credentials()
         auth = AWSV4SignerAuth(credentials, region, service)
         logger.info(f"Created AWS SigV4 authentication for region {region}")
         return auth
@@ -100,6 +170,65 @@ def create_basic_auth(username: str, password: str) -> HTTPBasicAuth:
     return HTTPBasicAuth(username, password)
 
 
+class OrjsonSerializer(JSONSerializer):
+    """JSON serializer backed by orjson, a faster drop-in for the stdlib json module."""
+
+    def loads(self, s: Any) -> Any:
+        """Deserialize a JSON response body.
+
+        :param s: JSON document.
+        :return: Deserialized data.
+        :raises SerializationError: If the document is not valid JSON.
+        """
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError as e:
+            raise SerializationError(s, e)
+
+    def dumps(self, data: Any) -> Any:
+        """Serialize a request body to JSON.
+
+        :param data: Data to serialize, strings are passed through unchanged.
+        :return: JSON document as bytes.
+        :raises SerializationError: If the data cannot be serialized.
+        """
+        if isinstance(data, str):
+            return data
+        try:
+            # YAML keys such as 1 or yes load as int or bool, which the stdlib json accepts
+            return orjson.dumps(data, default=self.default, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError as e:
+            raise SerializationError(data, e)
+
+
+@functools.lru_cache(maxsize=None)
+def get_serializer() -> JSONSerializer:
+    """Get the JSON serializer for OpenSearch clients.
+
+    :return: orjson-backed serializer if orjson is installed, the default one otherwise.
+    """
+    if _HAS_ORJSON:
+        return OrjsonSerializer()
+    return JSONSerializer()
+
+
+def warn_if_pool_too_small(env_config: Dict[str, Any], max_workers: int) -> None:
+    """Warn when more concurrent requests are planned than the connection pool holds.
+
+    Requests beyond the pool size still succeed, but each opens and then discards
+    its own connection, paying for a new TCP and TLS handshake.
+
+    :param env_config: Environment configuration.
+    :param max_workers: Number of requests that may run concurrently.
+    """
+    pool_maxsize = env_config.get("pool_maxsize", DEFAULT_POOL_MAXSIZE)
+    if max_workers > pool_maxsize:
+        logger.warning(
+            f"Running {max_workers} requests concurrently with a pool of {pool_maxsize} "
+            f"connections; set 'pool_maxsize' to at least {max_workers} to reuse connections"
+        )
+
+
 def get_connection_params(env_config: Dict[str, Any]) -> Dict[str, Any]:
     """Get connection parameters for OpenSearch client.
 
@@ -110,7 +239,10 @@ def get_connection_params(env_config: Dict[str, Any]) -> Dict[str, Any]:
         "hosts": [{"host": env_config["host"], "port": env_config["port"]}],
         "use_ssl": env_config.get("use_ssl", True),
         "verify_certs": env_config.get("verify_certs", True),
-        "connection_class": RequestsHttpConnection,
+        "connection_class": KeepAliveRequestsHttpConnection,
+        "pool_maxsize": env_config.get("pool_maxsize", DEFAULT_POOL_MAXSIZE),
+        "http_compress": env_config.get("http_compress", True),
+        "serializer": get_serializer(),
     }
 
     # Add AWS authentication if configured
@@ -127,10 +259,45 @@ def get_connection_params(env_config: Dict[str, Any]) -> Dict[str, Any]:
 
     # Configure proxy if specified
     if "proxy" in env_config:
-        connection_params["connection_class"] = (
-            lambda *args, **kwargs: ProxiedRequestsHttpConnection(
-                env_config["proxy"], *args, **kwargs
-            )
+        connection_params["connection_class"] = get_proxied_connection_class(
+            tuple(sorted(env_config["proxy"].items()))
         )
 
     return connection_params
+
+
+# OpenSearch clients shared between managers, keyed by client class and environment config
+_clients: Dict[Any, Any] = {}
+_clients_lock = threading.Lock()
+
+
+def _freeze(value: Any) -> Any:
+    """Convert a configuration value into a hashable equivalent.
+
+    :param value: Configuration value, possibly containing dicts and lists.
+    :return: Hashable representation of the value.
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def get_shared_client(env_config: Dict[str, Any], client_class: Any = OpenSearch) -> Any:
+    """Get an OpenSearch client for an environment, shared by all callers in the process.
+
+    Reusing the client keeps a single connection pool per environment, so managers
+    created for the same environment don't pay for new connections and TLS handshakes.
+
+    :param env_config: Environment configuration.
+    :param client_class: Client class to instantiate with the connection parameters.
+    :return: OpenSearch client.
+    """
+    key = (client_class, _freeze(env_config))
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = client_class(**get_connection_params(env_config))
+            _clients[key] = client
+    return client
@@ -2,59 +2,101 @@
 Command-line interface for opensearch-keeper.
 """
 
-import datetime
+import functools
 import logging
 import sys
-from typing import Optional
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Optional, Sequence
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
 from opensearch_keeper.config import Config
-from opensearch_keeper.template_manager import TemplateManager
-from opensearch_keeper.ism_policy_manager import ISMPolicyManager
-from opensearch_keeper.utils import setup_logging, format_template_list
+from opensearch_keeper.utils import setup_logging
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from opensearch_keeper.template_manager import TemplateManager
+    from opensearch_keeper.ism_policy_manager import ISMPolicyManager
 
 logger = logging.getLogger(__name__)
 
 # Create Typer app
 app = typer.Typer(help="Manage OpenSearch index templates and ISM policies.")
-templates_app = typer.Typer(help="Manage OpenSearch index templates.")
-ism_policies_app = typer.Typer(help="Manage OpenSearch ISM policies.")
 
-# Add subcommands
-app.add_typer(templates_app, name="templates")
-app.add_typer(ism_policies_app, name="ism-policies")
+# Subcommand groups and the modules defining them, in help order
+SUBCOMMAND_MODULES = {
+    "templates": "opensearch_keeper.templates_cli",
+    "ism-policies": "opensearch_keeper.ism_policies_cli",
+}
+# Root options that take a value, needed to find the subcommand in argv
+_VALUE_OPTIONS = ("--config", "-c")
+_registered_subcommands: set = set()
 
 # Global state for configuration
-config_instance = None
-console = Console()
+config_instance: Optional[Config] = None
+_config_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def get_console() -> "Console":
+    """Get the shared Rich console, creating it on first use.
+
+    :return: Console instance.
+    """
+    from rich.console import Console
+
+    return Console()
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve lazily created module attributes.
+
+    Keeps ``cli.console`` available without creating the console at import time.
+
+    :param name: Attribute name.
+    :return: Attribute value.
+    """
+    if name == "console":
+        return get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_config(config_path: Optional[str] = None) -> Config:
     """Get or create a Config instance.
 
+    The configuration is loaded once; the path passed on the first call wins,
+    so commands can call this without arguments after the main callback.
+
     :param config_path: Path to the configuration file.
     :return: Config instance.
     """
     global config_instance
     if config_instance is None:
-        try:
-            config_instance = Config(config_path)
-        except Exception as e:
-            logger.error(f"Failed to load configuration: {e}")
-            sys.exit(1)
+        with _config_lock:
+            if config_instance is None:
+                try:
+                    config_instance = Config(config_path)
+                except Exception as e:
+                    logger.error(f"Failed to load configuration: {e}")
+                    sys.exit(1)
     return config_instance
 
 
-def get_template_manager(config: Config, env: str) -> TemplateManager:
+@functools.lru_cache(maxsize=None)
+def get_template_manager(config: Config, env: str) -> "TemplateManager":
     """Create a template manager for the specified environment.
 
+    Managers are cached per environment, so every command in the process shares
+    one instance and its caches. Managers of the same environment also share
+    one OpenSearch client and its connection pool.
+
     :param config: Configuration object.
     :param env: Environment name.
     :return: TemplateManager instance.
     """
+    from opensearch_keeper.template_manager import TemplateManager
+
     try:
         env_config = config.get_environment_config(env)
         templates_dir = config.get_templates_dir(env)
@@ -65,13 +107,20 @@ def get_template_manager(config: Config, env: str) -> TemplateManager:
         sys.exit(1)
 
 
-def get_ism_policy_manager(config: Config, env: str) -> ISMPolicyManager:
+@functools.lru_cache(maxsize=None)
+def get_ism_policy_manager(config: Config, env: str) -> "ISMPolicyManager":
     """Create an ISM policy manager for the specified environment.
 
+    Managers are cached per environment, so every command in the process shares
+    one instance and its caches. Managers of the same environment also share
+    one OpenSearch client and its connection pool.
+
     :param config: Configuration object.
     :param env: Environment name.
     :return: ISMPolicyManager instance.
     """
+    from opensearch_keeper.ism_policy_manager import ISMPolicyManager
+
     try:
         env_config = config.get_environment_config(env)
         policies_dir = config.get_ism_policies_dir(env)
@@ -82,17 +131,38 @@ def get_ism_policy_manager(config: Config, env: str) -> ISMPolicyManager:
         sys.exit(1)
 
 
+def _print_version(value: bool) -> None:
+    """Print the version and exit.
+
+    :param value: Whether the version option was given.
+    """
+    if value:
+        from opensearch_keeper import __version__
+
+        typer.echo(f"opensearch-keeper {__version__}")
+        raise typer.Exit()
+
+
 @app.callback()
 def main(
     config: Optional[str] = typer.Option(
         None, "--config", "-c", help="Path to configuration file."
     ),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable verbose logging."),
+    version: bool = typer.Option(
+        False,
+        "--version",
+        "-V",
+        callback=_print_version,
+        is_eager=True,
+        help="Show the version and exit.",
+    ),
 ):
     """Manage OpenSearch index templates and ISM policies.
 
     :param config: Path to configuration file.
     :param verbose: Enable verbose logging.
+    :param version: Show the version and exit.
     """
     setup_logging(verbose)
     get_config(config)
@@ -101,6 +171,8 @@ def main(
 @app.command("environments")
 def list_environments():
     """List available environments from the configuration."""
+    from rich.table import Table
+
     config = get_config()
 
     try:
@@ -112,7 +184,7 @@ def list_environments():
             for env in environments:
                 table.add_row(env)
 
-            console.print(table)
+            get_console().print(table)
         else:
             typer.echo("No environments configured.")
     except Exception as e:
@@ -183,319 +255,137 @@ def install_completions(
         sys.exit(1)
 
 
-# Template commands
-@templates_app.command("list")
-def list_templates(
-    env: str = typer.Option(..., "--env", "-e", help="Environment to use (qa, prod, etc.)."),
-    pattern: Optional[str] = typer.Option(
-        None, "--pattern", "-p", help="Pattern to filter templates."
-    ),
-    format: str = typer.Option(
-        "table",
-        "--format",
-        "-f",
-        help="Output format (table, json, yaml).",
-        show_choices=True,
-        case_sensitive=False,
-    ),
-):
-    """List templates in OpenSearch.
-
-    :param env: Environment to use (qa, prod, etc.).
-    :param pattern: Pattern to filter templates.
-    :param format: Output format (table, json, yaml).
-    """
-    config = get_config()
-    template_manager = get_template_manager(config, env)
-
-    try:
-        templates = template_manager.list_templates(pattern)
-        typer.echo(format_template_list(templates, format))
-    except Exception as e:
-        logger.error(f"Failed to list templates: {e}")
-        sys.exit(1)
-
-
-@templates_app.command("save")
-def save_templates(
-    env: str = typer.Option(..., "--env", "-e", help="Environment to use (qa, prod, etc.)."),
-    pattern: Optional[str] = typer.Option(
-        None, "--pattern", "-p", help="Pattern to filter templates."
-    ),
-):
-    """Save templates from OpenSearch to local files.
-
-    :param env: Environment to use (qa, prod, etc.).
-    :param pattern: Pattern to filter templates.
-    """
-    config = get_config()
-    template_manager = get_template_manager(config, env)
-
-    try:
-        saved_files = template_manager.save_templates(pattern)
-        templates_dir = config.get_templates_dir(env)
-
-        if saved_files:
-            typer.echo(f"Saved {len(saved_files)} templates to {templates_dir}")
-        else:
-            typer.echo("No templates were saved.")
-    except Exception as e:
-        logger.error(f"Failed to save templates: {e}")
-        sys.exit(1)
-
-
-@templates_app.command("publish")
-def publish_templates(
-    env: str = typer.Option(..., "--env", "-e", help="Environment to use (qa, prod, etc.)."),
-    pattern: Optional[str] = typer.Option(
-        None, "--pattern", "-p", help="Pattern to filter templates."
-    ),
-):
-    """Publish templates from local files to OpenSearch.
-
-    :param env: Environment to use (qa, prod, etc.).
-    :param pattern: Pattern to filter templates.
-    """
-    config = get_config()
-    template_manager = get_template_manager(config, env)
-
-    try:
-        results = template_manager.publish_templates(pattern)
-
-        if not results:
-            typer.echo("No templates were published.")
-            return
-
-        success_count = sum(1 for success in results.values() if success)
-        fail_count = len(results) - success_count
-
-        typer.echo(f"Published {success_count} templates to OpenSearch")
-        if fail_count > 0:
-            typer.echo(f"Failed to publish {fail_count} templates")
-
-            # Show failed templates
-            typer.echo("\nFailed templates:")
-            for name, success in results.items():
-                if not success:
-                    typer.echo(f"- {name}")
-    except Exception as e:
-        logger.error(f"Failed to publish templates: {e}")
-        sys.exit(1)
-
-
-@templates_app.command("delete")
-def delete_template(
-    template_name: str = typer.Argument(..., help="Name of the template to delete."),
-    env: str = typer.Option(..., "--env", "-e", help="Environment to use (qa, prod, etc.)."),
-    force: bool = typer.Option(False, "--force", "-f", help="Skip confirmation prompt."),
-):
-    """Delete a template from OpenSearch.
-
-    :param template_name: Name of the template to delete.
-    :param env: Environment to use (qa, prod, etc.).
-    :param force: Skip confirmation prompt.
+def make_save_command(
+    get_manager: Callable[[Config, str], Any],
+    save_method: str,
+    dir_attr: str,
+    items_label: str,
+    pattern_help: str,
+) -> Callable[..., None]:
+    """Build a command that saves items from OpenSearch to local files.
+
+    :param get_manager: Function returning the manager for an environment.
+    :param save_method: Name of the manager method that saves the items.
+    :param dir_attr: Name of the manager attribute holding the target directory.
+    :param items_label: Plural label of the items, used in messages.
+    :param pattern_help: Help text for the pattern option.
+    :return: Command function.
     """
-    config = get_config()
-    template_manager = get_template_manager(config, env)
 
-    try:
-        if force or typer.confirm(f"Are you sure you want to delete template '{template_name}'?"):
-            success = template_manager.delete_template(template_name)
-            if success:
-                typer.echo(f"Template '{template_name}' was deleted.")
-            else:
-                typer.echo(f"Failed to delete template '{template_name}'.")
-                sys.exit(1)
-    except Exception as e:
-        logger.error(f"Failed to delete template: {e}")
-        sys.exit(1)
+    def save(
+        env: str = typer.Option(..., "--env", "-e", help="Environment to use (qa, prod, etc.)."),
+        pattern: Optional[str] = typer.Option(None, "--pattern", "-p", help=pattern_help),
+    ):
+        """Save items from OpenSearch to local files.
 
+        :param env: Environment to use (qa, prod, etc.).
+        :param pattern: Pattern to filter items.
+        """
+        config = get_config()
+        manager = get_manager(config, env)
 
-# ISM Policy commands
-@ism_policies_app.command("list")
-def list_ism_policies(
-    env: str = typer.Option(..., "--env", "-e", help="Environment to use (qa, prod, etc.)."),
-    pattern: Optional[str] = typer.Option(
-        None, "--pattern", "-p", help="Pattern to filter policies."
-    ),
-    format: str = typer.Option(
-        "table",
-        "--format",
-        "-f",
-        help="Output format (table, json, yaml).",
-        show_choices=True,
-        case_sensitive=False,
-    ),
-):
-    """List ISM policies in OpenSearch.
-
-    :param env: Environment to use (qa, prod, etc.).
-    :param pattern: Pattern to filter policies.
-    :param format: Output format (table, json, yaml).
-    """
-    config = get_config()
-    policy_manager = get_ism_policy_manager(config, env)
+        try:
+            saved_files = getattr(manager, save_method)(pattern)
 
-    try:
-        policies = policy_manager.list_policies(pattern)
-        formatted_policies = [
-            {"name": p["name"], "last_updated_time": p["last_updated_time"]} for p in policies
-        ]
-
-        # Format output similar to templates but for policies
-        if format == "json":
-            import json
-
-            typer.echo(json.dumps(formatted_policies, indent=2))
-        elif format == "yaml":
-            import yaml
-
-            typer.echo(yaml.dump(formatted_policies, default_flow_style=False, sort_keys=False))
-        else:  # table format
-            if not policies:
-                typer.echo("No ISM policies found.")
+            if saved_files:
+                typer.echo(
+                    f"Saved {len(saved_files)} {items_label} to {getattr(manager, dir_attr)}"
+                )
             else:
-                table = Table(title="ISM Policies")
-                table.add_column("Policy Name")
-                table.add_column("Last updated time, UTC")
-
-                for policy in policies:
-                    table.add_row(
-                        policy["name"],
-                        datetime.datetime.fromtimestamp(
-                            policy["last_updated_time"], datetime.UTC
-                        ).strftime("%Y-%m-%d %H:%M:%S"),
-                    )
-                console.print(table)
-    except Exception as e:
-        logger.exception(f"Failed to list ISM policies: {e}")
-        sys.exit(1)
-
-
-@ism_policies_app.command("save")
-def save_ism_policies(
-    env: str = typer.Option(..., "--env", "-e", help="Environment to use (qa, prod, etc.)."),
-    pattern: Optional[str] = typer.Option(
-        None, "--pattern", "-p", help="Pattern to filter policies."
-    ),
-):
-    """Save ISM policies from OpenSearch to local files.
-
-    :param env: Environment to use (qa, prod, etc.).
-    :param pattern: Pattern to filter policies.
-    """
-    config = get_config()
-    policy_manager = get_ism_policy_manager(config, env)
-
-    try:
-        saved_files = policy_manager.save_policies(pattern)
-        policies_dir = config.get_ism_policies_dir(env)
+                typer.echo(f"No {items_label} were saved.")
+        except Exception as e:
+            logger.error(f"Failed to save {items_label}: {e}")
+            sys.exit(1)
 
-        if saved_files:
-            typer.echo(f"Saved {len(saved_files)} ISM policies to {policies_dir}")
-        else:
-            typer.echo("No ISM policies were saved.")
-    except Exception as e:
-        logger.error(f"Failed to save ISM policies: {e}")
-        sys.exit(1)
+    return save
 
 
-@ism_policies_app.command("publish")
-def publish_ism_policies(
-    env: str = typer.Option(..., "--env", "-e", help="Environment to use (qa, prod, etc.)."),
-    pattern: Optional[str] = typer.Option(
-        None, "--pattern", "-p", help="Pattern to filter policies."
-    ),
-    force: bool = typer.Option(False, "--force", "-f", help="Skip confirmation prompt."),
-):
-    """Publish ISM policies from local files to OpenSearch.
+def make_delete_command(
+    get_manager: Callable[[Config, str], Any],
+    delete_method: str,
+    item_label: str,
+    metavar: str,
+) -> Callable[..., None]:
+    """Build a command that deletes a single item from OpenSearch.
 
-    :param env: Environment to use (qa, prod, etc.).
-    :param pattern: Pattern to filter policies.
-    :param force: Skip confirmation prompt.
+    :param get_manager: Function returning the manager for an environment.
+    :param delete_method: Name of the manager method that deletes the item.
+    :param item_label: Singular label of the item, used in messages.
+    :param metavar: Name of the item argument shown in help.
+    :return: Command function.
     """
-    config = get_config()
-    policy_manager = get_ism_policy_manager(config, env)
-
-    try:
-        # Get all local policy names that match the pattern
-        policy_names = policy_manager.list_local_policies_names(pattern)
+    item_title = item_label[0].upper() + item_label[1:]
+
+    def delete(
+        name: str = typer.Argument(
+            ..., metavar=metavar, help=f"Name of the {item_label} to delete."
+        ),
+        env: str = typer.Option(..., "--env", "-e", help="Environment to use (qa, prod, etc.)."),
+        force: bool = typer.Option(False, "--force", "-f", help="Skip confirmation prompt."),
+    ):
+        """Delete an item from OpenSearch.
+
+        :param name: Name of the item to delete.
+        :param env: Environment to use (qa, prod, etc.).
+        :param force: Skip confirmation prompt.
+        """
+        config = get_config()
+        manager = get_manager(config, env)
 
-        if not policy_names:
-            typer.echo("No local ISM policy files found matching the pattern.")
-            return
-
-        successful = {}
-        skipped = []
-
-        # Process each policy
-        for policy_name in policy_names:
-            # Check if policy exists and get diff
-            diff_result = policy_manager.diff_policy(policy_name)
-
-            if diff_result is None:
-                # Policy doesn't exist in OpenSearch yet - no confirmation needed
-                typer.echo(f"Creating new policy: {policy_name}")
-                success = policy_manager.publish_policy(policy_name)
+        try:
+            if force or typer.confirm(f"Are you sure you want to delete {item_label} '{name}'?"):
+                success = getattr(manager, delete_method)(name)
                 if success:
-                    successful[policy_name] = True
+                    typer.echo(f"{item_title} '{name}' was deleted.")
+                else:
+                    typer.echo(f"Failed to delete {item_label} '{name}'.")
+                    sys.exit(1)
+        except Exception as e:
+            logger.error(f"Failed to delete {item_label}: {e}")
+            sys.exit(1)
 
-            elif diff_result["has_changes"]:
-                # Policy exists and has changes
-                typer.echo(f"\nChanges for policy '{policy_name}':")
-                typer.echo(diff_result["diff"].pretty())
+    return delete
 
-                if force or typer.confirm("Apply these changes?"):
-                    success = policy_manager.publish_policy(policy_name)
-                    if success:
-                        successful[policy_name] = True
-                else:
-                    typer.echo(f"Skipping policy '{policy_name}'")
-                    skipped.append(policy_name)
 
-            else:
-                # Policy exists but no changes
-                typer.echo(f"No changes for policy '{policy_name}' - skipping")
-                skipped.append(policy_name)
+def _find_subcommand(args: Sequence[str]) -> Optional[str]:
+    """Find the subcommand name in command-line arguments.
 
-        # Show summary
-        if successful:
-            typer.echo(f"\nPublished {len(successful)} ISM policies to OpenSearch")
-        if skipped:
-            typer.echo(f"Skipped {len(skipped)} ISM policies")
+    :param args: Command-line arguments without the program name.
+    :return: The first positional argument, or None if there is none.
+    """
+    args_iter = iter(args)
+    for arg in args_iter:
+        if arg in _VALUE_OPTIONS:
+            next(args_iter, None)
+        elif not arg.startswith("-"):
+            return arg
+    return None
 
-    except Exception as e:
-        logger.error(f"Failed to publish ISM policies: {e}")
-        sys.exit(1)
 
+def register_subcommands(args: Optional[Sequence[str]] = None) -> None:
+    """Register subcommand groups on the Typer app.
 
-@ism_policies_app.command("delete")
-def delete_ism_policy(
-    policy_name: str = typer.Argument(..., help="Name of the ISM policy to delete."),
-    env: str = typer.Option(..., "--env", "-e", help="Environment to use (qa, prod, etc.)."),
-    force: bool = typer.Option(False, "--force", "-f", help="Skip confirmation prompt."),
-):
-    """Delete an ISM policy from OpenSearch.
+    When the arguments name a known group, only that group's module is
+    imported and registered; otherwise all groups are registered so help,
+    completion and error messages list every command.
 
-    :param policy_name: Name of the ISM policy to delete.
-    :param env: Environment to use (qa, prod, etc.).
-    :param force: Skip confirmation prompt.
+    :param args: Command-line arguments without the program name, or None
+                 to register every group.
     """
-    config = get_config()
-    policy_manager = get_ism_policy_manager(config, env)
+    import importlib
 
-    try:
-        if force or typer.confirm(f"Are you sure you want to delete ISM policy '{policy_name}'?"):
-            success = policy_manager.delete_policy(policy_name)
-            if success:
-                typer.echo(f"ISM policy '{policy_name}' was deleted.")
-            else:
-                typer.echo(f"Failed to delete ISM policy '{policy_name}'.")
-                sys.exit(1)
-    except Exception as e:
-        logger.error(f"Failed to delete ISM policy: {e}")
-        sys.exit(1)
+    subcommand = _find_subcommand(args) if args is not None else None
+    names = [subcommand] if subcommand in SUBCOMMAND_MODULES else list(SUBCOMMAND_MODULES)
+    for name in names:
+        if name not in _registered_subcommands:
+            module = importlib.import_module(SUBCOMMAND_MODULES[name])
+            app.add_typer(module.app, name=name)
+            _registered_subcommands.add(name)
 
 
 if __name__ == "__main__":
-    app()
+    # Run through the package entry point: subcommand modules import this module as
+    # opensearch_keeper.cli, and its configuration state must not live in a second copy
+    from opensearch_keeper.__main__ import main as _main
+
+    _main()
@@ -2,12 +2,15 @@
 Configuration module for opensearch-keeper.
 """
 
+import hashlib
 import os
 import logging
+import pickle
+import tempfile
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
-import yaml
+from opensearch_keeper.utils import get_yaml_classes
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +19,74 @@ DEFAULT_CONFIG_PATHS = [
     "~/.opensearch-keeper/config.yaml",
     "/etc/opensearch-keeper/config.yaml",
 ]
+_EXPANDED_CONFIG_PATHS = tuple(os.path.expanduser(path) for path in DEFAULT_CONFIG_PATHS)
+
+
+def get_cache_dir() -> Path:
+    """Get the directory where parsed configuration files are cached.
+
+    :return: Path to the cache directory.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or "~/.cache"
+    return Path(cache_home).expanduser() / "opensearch-keeper"
+
+
+def _get_cache_path(config_path: str, stat: os.stat_result) -> Path:
+    """Get the cache file path for a configuration file.
+
+    The modification time and size are part of the name, so editing the
+    configuration file naturally invalidates its cache entry.
+
+    :param config_path: Path to the configuration file.
+    :param stat: Result of os.stat() for the configuration file.
+    :return: Path to the cache file.
+    """
+    digest = hashlib.sha1(os.path.abspath(config_path).encode()).hexdigest()
+    return get_cache_dir() / f"{digest}.{stat.st_mtime_ns}.{stat.st_size}.pkl"
+
+
+def _read_cache(cache_path: Path) -> Optional[Dict[str, Any]]:
+    """Read parsed configuration data from the cache.
+
+    :param cache_path: Path to the cache file.
+    :return: Cached configuration data, or None if there is no usable cache entry.
+    """
+    try:
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable configuration cache {cache_path}: {e}")
+        return None
+
+
+def _write_cache(cache_path: Path, config_data: Dict[str, Any]) -> None:
+    """Write parsed configuration data to the cache atomically.
+
+    Failures are logged and ignored, the cache is only an optimization.
+
+    :param cache_path: Path to the cache file.
+    :param config_data: Parsed configuration data.
+    """
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(config_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+        # Drop entries left behind by earlier versions of the same file
+        digest = cache_path.name.split(".", 1)[0]
+        for stale_path in cache_path.parent.glob(f"{digest}.*.pkl"):
+            if stale_path != cache_path:
+                stale_path.unlink(missing_ok=True)
+    except Exception as e:
+        logger.debug(f"Failed to write configuration cache {cache_path}: {e}")
 
 
 class Config:
@@ -28,16 +99,20 @@ class Config:
         """
         self.config_data: dict[str, Any] = {}
         self.config_path: Optional[str] = None
+        self._read_settings()
+        self._created_dirs: set[str] = set()
+        self._env_dirs: dict[tuple[str, str], str] = {}
 
         # Try to load config from specified path or default paths
         if config_path:
             self._load_config(config_path)
         else:
-            for path in DEFAULT_CONFIG_PATHS:
-                expanded_path = os.path.expanduser(path)
-                if os.path.exists(expanded_path):
-                    self._load_config(expanded_path)
+            for path in _EXPANDED_CONFIG_PATHS:
+                try:
+                    self._load_config(path)
                     break
+                except FileNotFoundError:
+                    continue
             else:
                 logger.warning(
                     f"No configuration file found in default paths: {DEFAULT_CONFIG_PATHS}"
@@ -46,19 +121,40 @@ class Config:
     def _load_config(self, config_path: str) -> None:
         """Load configuration from a YAML file.
 
+        The parsed data is cached on disk keyed by the file's path, size and
+        modification time, so repeated invocations skip YAML parsing.
+
         :param config_path: Path to the configuration file.
+        :raises FileNotFoundError: If the configuration file does not exist.
         """
         try:
-            with open(config_path, "r") as f:
-                self.config_data = yaml.safe_load(f)
-            if self.config_data is None:
-                self.config_data = {}
+            cache_path = _get_cache_path(config_path, os.stat(config_path))
+            cached_data = _read_cache(cache_path)
+            if cached_data is not None:
+                self.config_data = cached_data
+            else:
+                import yaml
+
+                yaml_loader, _ = get_yaml_classes()
+                self.config_data = (
+                    yaml.load(Path(config_path).read_bytes(), Loader=yaml_loader) or {}
+                )
+                _write_cache(cache_path, self.config_data)
+            self._read_settings()
             self.config_path = config_path
             logger.info(f"Loaded configuration from {config_path}")
+        except FileNotFoundError:
+            raise
         except Exception as e:
             logger.error(f"Failed to load configuration from {config_path}: {e}")
             raise
 
+    def _read_settings(self) -> None:
+        """Extract the settings used by the getters from the configuration data once."""
+        self.environments: Dict[str, Dict[str, Any]] = self.config_data.get("environments") or {}
+        self.storage_dir: str = self.config_data.get("storage_dir", "./dump")
+        self.ignore_patterns: List[str] = self.config_data.get("ignore_patterns") or []
+
     def get_environment_config(self, env_name: str) -> Dict[str, Any]:
         """Get configuration for a specific environment.
 
@@ -66,23 +162,46 @@ class Config:
         :return: Dictionary with environment configuration.
         :raises ValueError: If the environment is not defined in the configuration.
         """
-        environments = self.config_data.get("environments", {})
-        if env_name not in environments:
+        if env_name not in self.environments:
             raise ValueError(
                 f"Environment '{env_name}' not found in configuration. "
-                f"Available environments: {list(environments.keys())}"
+                f"Available environments: {list(self.environments)}"
             )
-        return environments[env_name]
+        return self.environments[env_name]
+
+    def _ensure_dir(self, path: str) -> None:
+        """Create a directory if it doesn't exist, checking at most once per path.
+
+        :param path: Path to the directory.
+        """
+        if path not in self._created_dirs:
+            # A stat is cheaper than a mkdir failing with EEXIST, notably on network filesystems
+            if not os.path.isdir(path):
+                Path(path).mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(path)
 
     def get_storage_dir(self) -> str:
         """Get the base storage directory for all artifacts.
 
         :return: Path to the storage directory.
         """
-        storage_dir = self.config_data.get("storage_dir", "./dump")
-        # Create the directory if it doesn't exist
-        Path(storage_dir).mkdir(parents=True, exist_ok=True)
-        return storage_dir
+        self._ensure_dir(self.storage_dir)
+        return self.storage_dir
+
+    def _get_env_subdir(self, env_name: str, kind: str) -> str:
+        """Get a per-environment artifact directory, creating it if needed.
+
+        :param env_name: Name of the environment.
+        :param kind: Kind of artifacts stored in the directory (e.g., 'templates').
+        :return: Path to the directory.
+        """
+        key = (env_name, kind)
+        path = self._env_dirs.get(key)
+        if path is None:
+            path = os.path.join(self.get_storage_dir(), env_name, kind)
+            self._ensure_dir(path)
+            self._env_dirs[key] = path
+        return path
 
     def get_templates_dir(self, env_name: str) -> str:
         """Get the directory where templates should be saved for a specific environment.
@@ -90,11 +209,7 @@ class Config:
         :param env_name: Name of the environment.
         :return: Path to the templates directory.
         """
-        storage_dir = self.get_storage_dir()
-        templates_dir = os.path.join(storage_dir, env_name, "templates")
-        # Create the directory if it doesn't exist
-        Path(templates_dir).mkdir(parents=True, exist_ok=True)
-        return templates_dir
+        return self._get_env_subdir(env_name, "templates")
 
     def get_ism_policies_dir(self, env_name: str) -> str:
         """Get the directory where ISM policies should be saved for a specific environment.
@@ -102,22 +217,18 @@ class Config:
         :param env_name: Name of the environment.
         :return: Path to the ISM policies directory.
         """
-        storage_dir = self.get_storage_dir()
-        policies_dir = os.path.join(storage_dir, env_name, "ism_policies")
-        # Create the directory if it doesn't exist
-        Path(policies_dir).mkdir(parents=True, exist_ok=True)
-        return policies_dir
+        return self._get_env_subdir(env_name, "ism_policies")
 
     def get_ignore_patterns(self) -> List[str]:
         """Get the list of template name patterns to ignore.
 
         :return: List of patterns to ignore.
         """
-        return self.config_data.get("ignore_patterns", [])
+        return self.ignore_patterns
 
     def get_available_environments(self) -> List[str]:
         """Get a list of available environment names.
 
         :return: List of environment names.
         """
-        return list(self.config_data.get("environments", {}).keys())
+        return list(self.environments)
@@ -0,0 +1,216 @@
+"""
+Command-line interface for managing OpenSearch ISM policies.
+"""
+
+import logging
+import sys
+from typing import Optional
+
+import typer
+
+from opensearch_keeper.cli import (
+    get_console,
+    get_config,
+    get_ism_policy_manager,
+    make_delete_command,
+    make_save_command,
+)
+from opensearch_keeper.utils import (
+    DEFAULT_MAX_WORKERS,
+    format_policy_diff,
+    format_timestamp,
+    get_json_dumps,
+    get_yaml_classes,
+)
+
+logger = logging.getLogger(__name__)
+
+app = typer.Typer(help="Manage OpenSearch ISM policies.")
+
+
+@app.command("list")
+def list_ism_policies(
+    env: str = typer.Option(..., "--env", "-e", help="Environment to use (qa, prod, etc.)."),
+    pattern: Optional[str] = typer.Option(
+        None, "--pattern", "-p", help="Pattern to filter policies."
+    ),
+    format: str = typer.Option(
+        "table",
+        "--format",
+        "-f",
+        help="Output format (table, json, yaml).",
+        show_choices=True,
+        case_sensitive=False,
+    ),
+):
+    """List ISM policies in OpenSearch.
+
+    :param env: Environment to use (qa, prod, etc.).
+    :param pattern: Pattern to filter policies.
+    :param format: Output format (table, json, yaml).
+    """
+    config = get_config()
+    policy_manager = get_ism_policy_manager(config, env)
+
+    try:
+        # Only the name and update time are displayed, so skip the policy bodies
+        policies = policy_manager.list_policies(pattern, fields=("name", "last_updated_time"))
+
+        # Format output similar to templates but for policies
+        if format == "json":
+            sys.stdout.write(get_json_dumps()(policies))
+            sys.stdout.write("\n")
+        elif format == "yaml":
+            import yaml
+
+            yaml.dump(
+                policies,
+                sys.stdout,
+                Dumper=get_yaml_classes()[1],
+                default_flow_style=False,
+                sort_keys=False,
+            )
+        else:  # table format
+            if not policies:
+                typer.echo("No ISM policies found.")
+            else:
+                from rich.table import Table
+
+                table = Table(title="ISM Policies")
+                table.add_column("Policy Name")
+                table.add_column("Last updated time, UTC")
+
+                for policy in policies:
+                    table.add_row(policy["name"], format_timestamp(policy["last_updated_time"]))
+                get_console().print(table)
+    except Exception as e:
+        logger.exception(f"Failed to list ISM policies: {e}")
+        sys.exit(1)
+
+
+save_ism_policies = app.command("save", help="Save ISM policies from OpenSearch to local files.")(
+    make_save_command(
+        get_ism_policy_manager,
+        "save_policies",
+        "policies_dir",
+        "ISM policies",
+        "Pattern to filter policies.",
+    )
+)
+
+
+@app.command("publish")
+def publish_ism_policies(
+    env: str = typer.Option(..., "--env", "-e", help="Environment to use (qa, prod, etc.)."),
+    pattern: Optional[str] = typer.Option(
+        None, "--pattern", "-p", help="Pattern to filter policies."
+    ),
+    force: bool = typer.Option(False, "--force", "-f", help="Skip confirmation prompt."),
+    parallel: int = typer.Option(
+        DEFAULT_MAX_WORKERS,
+        "--parallel",
+        "-j",
+        min=1,
+        help="Number of policies to diff and publish concurrently.",
+    ),
+    skip_unchanged: bool = typer.Option(
+        False,
+        "--skip-unchanged",
+        help="Skip policy files unchanged since they were last saved or published with this "
+        "option, without comparing them with OpenSearch.",
+    ),
+):
+    """Publish ISM policies from local files to OpenSearch.
+
+    :param env: Environment to use (qa, prod, etc.).
+    :param pattern: Pattern to filter policies.
+    :param force: Skip confirmation prompt.
+    :param parallel: Number of policies to diff and publish concurrently.
+    :param skip_unchanged: Skip policy files unchanged since they were last saved or
+                           published with this option.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from functools import partial
+
+    from opensearch_keeper.auth import warn_if_pool_too_small
+
+    config = get_config()
+    policy_manager = get_ism_policy_manager(config, env)
+
+    try:
+        # Get all local policy names that match the pattern
+        policy_names = policy_manager.list_local_policies_names(pattern, skip_unchanged)
+
+        if not policy_names:
+            if skip_unchanged:
+                typer.echo("No changed local ISM policy files found matching the pattern.")
+            else:
+                typer.echo("No local ISM policy files found matching the pattern.")
+            return
+
+        to_publish = []
+        skipped = []
+        # Policies whose local files already match OpenSearch
+        unchanged = []
+        # Sequence numbers fetched while diffing, so publishing needn't fetch them again
+        existing = {}
+
+        max_workers = min(parallel, len(policy_names))
+        warn_if_pool_too_small(policy_manager.env_config, max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Check if policies exist and get diffs concurrently
+            diff_results = executor.map(policy_manager.diff_policy, policy_names)
+
+            # Confirmation prompts must stay sequential
+            for policy_name, diff_result in zip(policy_names, diff_results):
+                if diff_result is None:
+                    # Policy doesn't exist in OpenSearch yet - no confirmation needed
+                    typer.echo(f"Creating new policy: {policy_name}")
+                    to_publish.append(policy_name)
+
+                elif diff_result["has_changes"]:
+                    # Policy exists and has changes
+                    typer.echo(f"\nChanges for policy '{policy_name}':")
+                    typer.echo(format_policy_diff(diff_result["diff"]))
+
+                    if force or typer.confirm("Apply these changes?"):
+                        to_publish.append(policy_name)
+                        existing[policy_name] = (
+                            diff_result["seq_no"],
+                            diff_result["primary_term"],
+                        )
+                    else:
+                        typer.echo(f"Skipping policy '{policy_name}'")
+                        skipped.append(policy_name)
+
+                else:
+                    # Policy exists but no changes
+                    typer.echo(f"No changes for policy '{policy_name}' - skipping")
+                    skipped.append(policy_name)
+                    unchanged.append(policy_name)
+
+            # Publish all approved policies concurrently
+            results = list(
+                executor.map(partial(policy_manager.publish_policy, existing=existing), to_publish)
+            )
+        successful = sum(results)
+
+        policy_manager.record_published_policies(
+            [name for name, success in zip(to_publish, results) if success] + unchanged,
+            create=skip_unchanged,
+        )
+
+        # Show summary
+        if successful:
+            typer.echo(f"\nPublished {successful} ISM policies to OpenSearch")
+        if skipped:
+            typer.echo(f"Skipped {len(skipped)} ISM policies")
+
+    except Exception as e:
+        logger.error(f"Failed to publish ISM policies: {e}")
+        sys.exit(1)
+
+
+delete_ism_policy = app.command("delete", help="Delete an ISM policy from OpenSearch.")(
+    make_delete_command(get_ism_policy_manager, "delete_policy", "ISM policy", "POLICY_NAME")
+)
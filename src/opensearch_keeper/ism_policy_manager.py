@@ -2,50 +2,260 @@
 ISM policy management module for OpenSearch.
 """
 
-import fnmatch
+import hashlib
+import json
 import logging
 import os
-from typing import Dict, Any, List, Optional
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from collections import defaultdict
+from functools import partial
+from typing import Dict, Any, Iterable, List, Optional, Sequence, Tuple
 
-import yaml
 from opensearchpy import OpenSearch
 from opensearchpy.exceptions import NotFoundError
 from opensearchpy.plugins.index_management import IndexManagementClient
 
-from opensearch_keeper.auth import get_connection_params
+from opensearch_keeper.auth import get_shared_client, warn_if_pool_too_small
+from opensearch_keeper.utils import DEFAULT_MAX_WORKERS, compile_patterns, get_yaml_classes
 
 logger = logging.getLogger(__name__)
 
+POLICY_FILE_EXTENSIONS = (".yaml", ".yml")
+# Extensions without the leading dot, matched against the text after a file name's last dot
+_POLICY_FILE_SUFFIXES = frozenset(extension[1:] for extension in POLICY_FILE_EXTENSIONS)
+
+# Digests of policy file contents known to match OpenSearch, kept in the policies directory
+# once publishing with skip_unchanged was used
+MANIFEST_FILENAME = ".manifest.json"
+
+# Policies fetched per request when listing policies, the API returns 20 by default
+POLICY_PAGE_SIZE = 1000
+
+# Server-maintained policy fields that are not part of the policy definition
+_META_KEYS = frozenset({"last_updated_time", "schema_version", "policy_id"})
+
+
+# Parsed policy files keyed by path, holding the (mtime_ns, size) they were parsed at
+# and the digest of their contents
+_yaml_cache: Dict[str, Tuple[Tuple[int, int], Any, str]] = {}
+
+
+def _content_digest(data: bytes) -> str:
+    """Compute the digest recorded in the policy manifest.
+
+    :param data: File contents.
+    :return: Hex digest of the contents.
+    """
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _read_policy_file(path: str) -> Tuple[Any, str]:
+    """Load a YAML file and digest its contents, reusing the result while the file is unchanged.
+
+    The returned data is shared between callers and must not be modified.
+
+    :param path: Path to the YAML file.
+    :return: Tuple of (parsed YAML data, digest of the file contents).
+    """
+    stat = os.stat(path)
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _yaml_cache.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1], cached[2]
+
+    import yaml
+
+    yaml_loader, _ = get_yaml_classes()
+    with open(path, "rb") as f:
+        raw = f.read()
+    data = yaml.load(raw, Loader=yaml_loader)
+    digest = _content_digest(raw)
+    _yaml_cache[path] = (key, data, digest)
+    return data, digest
+
+
+def _file_digest(path: str) -> str:
+    """Digest a file's contents without parsing it.
+
+    :param path: Path to the file.
+    :return: Hex digest of the contents.
+    """
+    with open(path, "rb") as f:
+        return _content_digest(f.read())
+
+
+def _load_yaml_cached(path: str) -> Any:
+    """Load a YAML file, reusing the parsed result while the file is unchanged.
+
+    The returned data is shared between callers and must not be modified.
+
+    :param path: Path to the YAML file.
+    :return: Parsed YAML data.
+    """
+    return _read_policy_file(path)[0]
+
+
+def _strip_policy_metadata(policy_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of a policy definition without server-maintained metadata.
+
+    The input is left untouched, so responses can be cleaned without copying them first.
+
+    :param policy_data: Policy definition as returned by OpenSearch.
+    :return: Policy definition without metadata fields.
+    """
+    cleaned = {key: value for key, value in policy_data.items() if key not in _META_KEYS}
+
+    # Remove metadata from ism_template if present
+    ism_template_list = cleaned.get("ism_template")
+    if isinstance(ism_template_list, list):
+        cleaned["ism_template"] = [
+            {key: value for key, value in item.items() if key != "last_updated_time"}
+            if isinstance(item, dict)
+            else item
+            for item in ism_template_list
+        ]
+    return cleaned
+
+
+def _with_str_keys(value: Any) -> Any:
+    """Convert dictionary keys to strings the way JSON serialization does, recursively.
+
+    :param value: Value parsed from YAML or JSON.
+    :return: Value whose dictionaries only have string keys.
+    """
+    if isinstance(value, dict):
+        return {
+            key if isinstance(key, str) else json.dumps(key, default=str): _with_str_keys(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_with_str_keys(item) for item in value]
+    return value
+
+
+def _canonical(value: Any) -> str:
+    """Serialize a value to a string that is the same for equal values, regardless of key order.
+
+    :param value: Value parsed from YAML or JSON.
+    :return: Canonical JSON representation of the value.
+    """
+    return json.dumps(_with_str_keys(value), sort_keys=True, default=str)
+
+
+def _compare_values(remote: Any, local: Any, path: str, diff: Dict[str, Dict[str, Any]]) -> None:
+    """Recursively record the differences between two values.
+
+    :param remote: Value in OpenSearch.
+    :param local: Value in the local file.
+    :param path: Path of the values, as in root['states'][0].
+    :param diff: Dictionary with 'added', 'removed' and 'changed' entries to update.
+    """
+    if isinstance(remote, dict) and isinstance(local, dict):
+        for key, value in remote.items():
+            key_path = f"{path}[{key!r}]"
+            if key in local:
+                _compare_values(value, local[key], key_path, diff)
+            else:
+                diff["removed"][key_path] = value
+        for key, value in local.items():
+            if key not in remote:
+                diff["added"][f"{path}[{key!r}]"] = value
+    elif isinstance(remote, list) and isinstance(local, list):
+        # Order of list items doesn't matter, match equal items as multisets
+        unmatched: Dict[str, List[int]] = defaultdict(list)
+        for index, item in enumerate(remote):
+            unmatched[_canonical(item)].append(index)
+        added: List[int] = []
+        for index, item in enumerate(local):
+            remote_indices = unmatched.get(_canonical(item))
+            if remote_indices:
+                remote_indices.pop(0)
+            else:
+                added.append(index)
+        removed = sorted(index for indices in unmatched.values() for index in indices)
+
+        if len(removed) == 1 and len(added) == 1:
+            # A single replaced item is compared in detail
+            _compare_values(remote[removed[0]], local[added[0]], f"{path}[{added[0]}]", diff)
+            return
+        for index in removed:
+            diff["removed"][f"{path}[{index}]"] = remote[index]
+        for index in added:
+            diff["added"][f"{path}[{index}]"] = local[index]
+    elif type(remote) is not type(local) or remote != local:
+        diff["changed"][path] = (remote, local)
+
+
+def _policy_diff(remote: Dict[str, Any], local: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Compare a remote policy definition with a local one, ignoring the order of list items.
+
+    :param remote: Policy definition in OpenSearch.
+    :param local: Policy definition in the local file.
+    :return: Dictionary with 'added' and 'removed' values and 'changed' (old, new) pairs,
+             each keyed by path, or None if the definitions are equal.
+    """
+    diff: Dict[str, Dict[str, Any]] = {"added": {}, "removed": {}, "changed": {}}
+    _compare_values(remote, local, "root", diff)
+    if not any(diff.values()):
+        return None
+    return diff
+
+
+def _write_bytes(path: str, data: bytes) -> None:
+    """Write a file with unbuffered os-level calls.
+
+    :param path: Path to the file, truncated if it exists.
+    :param data: File contents.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
 
 class ISMPolicyManager:
     """Manager for OpenSearch Index State Management policies."""
 
-    def __init__(self, env_config: Dict[str, Any], policies_dir: str, ignore_patterns: List[str]):
+    def __init__(
+        self,
+        env_config: Dict[str, Any],
+        policies_dir: str,
+        ignore_patterns: List[str],
+        verify_connection: bool = False,
+    ):
         """Initialize the ISM policy manager.
 
         :param env_config: Environment configuration.
         :param policies_dir: Directory where ISM policies will be saved.
         :param ignore_patterns: List of policy name patterns to ignore.
+        :param verify_connection: Test the connection when creating the client. Otherwise
+                                  connection errors surface on the first API call.
         """
         self.env_config = env_config
         self.policies_dir = policies_dir
         self.ignore_patterns = ignore_patterns
-        self.client = self._create_client()
+        self._ignore_re = compile_patterns(ignore_patterns)
+        self.client = self._create_client(verify_connection)
         self.ism_client = IndexManagementClient(self.client)
 
-    def _create_client(self) -> OpenSearch:
-        """Create an OpenSearch client.
+    def _create_client(self, verify_connection: bool = False) -> OpenSearch:
+        """Get the OpenSearch client for the environment, shared with other managers.
 
+        :param verify_connection: Test the connection with an extra round-trip.
         :return: OpenSearch client.
         """
-        connection_params = get_connection_params(self.env_config)
         try:
-            client = OpenSearch(**connection_params)
-            # Test the connection
-            client.info()
-            logger.info(
-                f"Connected to OpenSearch at {self.env_config['host']}:{self.env_config['port']}"
-            )
+            client = get_shared_client(self.env_config, OpenSearch)
+            address = f"{self.env_config['host']}:{self.env_config['port']}"
+            if verify_connection:
+                client.info()
+                logger.info(f"Connected to OpenSearch at {address}")
+            else:
+                logger.debug(f"Using OpenSearch client for {address}")
             return client
         except Exception as e:
             logger.error(f"Failed to connect to OpenSearch: {e}")
@@ -57,61 +267,151 @@ class ISMPolicyManager:
         :param policy_name: Name of the policy.
         :return: True if the policy should be ignored, False otherwise.
         """
-        for pattern in self.ignore_patterns:
-            if fnmatch.fnmatch(policy_name, pattern):
-                return True
-        return False
+        return self._ignore_re is not None and self._ignore_re.match(policy_name) is not None
 
     def _find_policy_file(self, policy_name: str) -> Optional[str]:
         """Find the policy file path for a given policy name.
 
-        Searches for policy_name.yaml in the policies directory.
+        Searches for policy_name.yaml or policy_name.yml in the policies directory.
 
         :param policy_name: The name of the policy (without extension).
         :return: The full path to the policy file, or None if not found.
         """
-        file_path = os.path.join(self.policies_dir, f"{policy_name}.yaml")
-        if os.path.exists(file_path):
-            logger.debug(f"Found policy file for '{policy_name}': {file_path}")
-            return file_path
+        for extension in POLICY_FILE_EXTENSIONS:
+            file_path = os.path.join(self.policies_dir, f"{policy_name}{extension}")
+            if os.path.exists(file_path):
+                logger.debug(f"Found policy file for '{policy_name}': {file_path}")
+                return file_path
         logger.warning(f"Policy file for '{policy_name}' not found in {self.policies_dir}")
         return None
 
-    def _cleanup_policy_metadata(self, policy_data: Dict[str, Any]) -> None:
-        """Remove metadata fields from a policy dictionary in-place."""
-        # Remove top-level metadata
-        policy_data.pop("last_updated_time", None)
-        policy_data.pop("schema_version", None)
-        policy_data.pop(
-            "policy_id", None
-        )  # policy_id is often used as the name, ensure it's handled before cleanup
-
-        # Remove metadata from ism_template if present
-        ism_template_list = policy_data.get("ism_template")
-        if isinstance(ism_template_list, list):
-            for ism_template_item in ism_template_list:
-                if isinstance(ism_template_item, dict):
-                    ism_template_item.pop("last_updated_time", None)
-
-    def list_local_policies_names(self, pattern: Optional[str] = None) -> List[str]:
+    def _load_manifest(self) -> Dict[str, str]:
+        """Load the manifest of policy contents known to match OpenSearch.
+
+        :return: Dictionary mapping policy names to digests of their file contents.
+        """
+        manifest_path = os.path.join(self.policies_dir, MANIFEST_FILENAME)
+        try:
+            with open(manifest_path, "rb") as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable policy manifest {manifest_path}: {e}")
+            return {}
+        return manifest if isinstance(manifest, dict) else {}
+
+    def _update_manifest(self, updates: Dict[str, Optional[str]], create: bool = False) -> None:
+        """Apply a batch of changes to the manifest with a single read and write.
+
+        The manifest is only maintained once it exists, so it isn't written into
+        directories of users who never skip unchanged policies. Failures are logged
+        and ignored, the manifest is only an optimization.
+
+        :param updates: Dictionary mapping policy names to digests of their file contents,
+                        or to None to remove their entries.
+        :param create: Create the manifest if it doesn't exist yet.
+        """
+        manifest_path = os.path.join(self.policies_dir, MANIFEST_FILENAME)
+        if not updates or not (create or os.path.exists(manifest_path)):
+            return
+
+        manifest = self._load_manifest()
+        updated = dict(manifest)
+        for policy_name, digest in updates.items():
+            if digest is None:
+                updated.pop(policy_name, None)
+            else:
+                updated[policy_name] = digest
+        if updated == manifest and os.path.exists(manifest_path):
+            return
+
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.policies_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(updated, f, indent=2, sort_keys=True)
+                os.replace(tmp_path, manifest_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            logger.warning(f"Failed to update policy manifest in {self.policies_dir}: {e}")
+
+    def record_published_policies(self, policy_names: Iterable[str], create: bool = False) -> None:
+        """Record that the local files of policies match their definitions in OpenSearch.
+
+        :param policy_names: Names of the policies that were published.
+        :param create: Create the manifest if it doesn't exist yet.
+        """
+        policy_files = self._scan_policy_files()
+        self._update_manifest(
+            {
+                policy_name: _read_policy_file(policy_files[policy_name])[1]
+                for policy_name in policy_names
+                if policy_name in policy_files
+            },
+            create=create,
+        )
+
+    def _drop_unchanged(self, policy_files: Dict[str, str]) -> Dict[str, str]:
+        """Leave out policy files whose contents match their manifest entry.
+
+        :param policy_files: Dictionary mapping policy names to policy file paths.
+        :return: Dictionary of the changed or unknown policy files.
+        """
+        manifest = self._load_manifest()
+        return {
+            name: path
+            for name, path in policy_files.items()
+            if name not in manifest or manifest[name] != _file_digest(path)
+        }
+
+    def _scan_policy_files(self, pattern: Optional[str] = None) -> Dict[str, str]:
+        """Map local policy names to their file paths in a single directory pass.
+
+        :param pattern: Optional fnmatch pattern to filter policy names.
+        :return: Dictionary mapping policy names to policy file paths.
+        """
+        pattern_re = compile_patterns([pattern]) if pattern else None
+        policy_files = {}
+        with os.scandir(self.policies_dir) as entries:
+            for entry in entries:
+                policy_name, dot, suffix = entry.name.rpartition(".")
+                if not dot or suffix not in _POLICY_FILE_SUFFIXES or not entry.is_file():
+                    continue
+                if pattern_re is not None and pattern_re.match(policy_name) is None:
+                    continue
+                if policy_name in policy_files:
+                    # Prefer the .yaml file like _find_policy_file, whatever the listing order
+                    logger.warning(
+                        f"Both {policy_name}.yaml and {policy_name}.yml exist in "
+                        f"{self.policies_dir}, using {policy_name}.yaml"
+                    )
+                    if suffix != "yaml":
+                        continue
+                policy_files[policy_name] = entry.path
+        return policy_files
+
+    def list_local_policies_names(
+        self, pattern: Optional[str] = None, skip_unchanged: bool = False
+    ) -> List[str]:
         """List local ISM policy names from the policies directory.
 
-        Filters files based on .yaml extension and an optional pattern.
+        Filters files based on .yaml/.yml extension and an optional pattern.
 
         :param pattern: Optional fnmatch pattern to filter policy names.
+        :param skip_unchanged: Leave out policy files whose contents match what was last
+                               published to OpenSearch with skip_unchanged.
         :return: List of policy names (filenames without extensions).
         """
-        policy_names = []
         try:
-            for filename in os.listdir(self.policies_dir):
-                if filename.endswith(".yaml"):
-                    policy_name = os.path.splitext(filename)[0]
-                    if self._should_ignore(policy_name):
-                        continue
-                    # Apply pattern filtering if provided
-                    if pattern and not fnmatch.fnmatch(policy_name, pattern):
-                        continue
-                    policy_names.append(policy_name)
+            policy_files = self._scan_policy_files(pattern)
+            if skip_unchanged:
+                policy_files = self._drop_unchanged(policy_files)
+            policy_names = [
+                policy_name for policy_name in policy_files if not self._should_ignore(policy_name)
+            ]
         except FileNotFoundError:
             logger.error(f"Policies directory not found: {self.policies_dir}")
             return []  # Return empty list if directory doesn't exist
@@ -120,13 +420,40 @@ class ISMPolicyManager:
             return []  # Return empty list on other errors
         return policy_names
 
-    def list_policies(self, pattern: Optional[str] = None) -> List[Dict[str, Any]]:
+    def _get_all_policies(self) -> List[Any]:
+        """Fetch all policies in OpenSearch, a page of policies per request.
+
+        :return: List of 'policies' items from the API responses.
+        :raises ValueError: If a response has no 'policies' list.
+        """
+        raw_policies: List[Any] = []
+        while True:
+            response = self.ism_client.get_policy(
+                params={"size": POLICY_PAGE_SIZE, "from": len(raw_policies)}
+            )
+            page = response.get("policies")
+
+            # Validate the structure of the response
+            if not isinstance(page, list):
+                logger.error(
+                    "Failed to list ISM policies: 'policies' key missing or not a list in response."
+                )
+                raise ValueError("Invalid response format from get_policy API")
+
+            raw_policies.extend(page)
+            if not page or len(raw_policies) >= response.get("total_policies", 0):
+                return raw_policies
+
+    def list_policies(
+        self, pattern: Optional[str] = None, fields: Optional[Sequence[str]] = None
+    ) -> List[Dict[str, Any]]:
         """List ISM policies in OpenSearch, cleaning up metadata.
 
         Retrieves policies, filters them based on an optional pattern and
         internal ignore list, and cleans up metadata fields before returning.
 
         :param pattern: Optional fnmatch pattern to filter policies by name.
+        :param fields: Optional subset of keys to include in each returned dictionary.
         :return: A list of dictionaries, where each dictionary represents a policy
                  and contains:
                  - 'name': The name of the policy (str).
@@ -136,19 +463,12 @@ class ISMPolicyManager:
         :raises ValueError: If the response structure from the API is unexpected.
         """
         try:
+            pattern_re = compile_patterns([pattern]) if pattern else None
+
             # Get all policies using the Index Management plugin client
-            response = self.ism_client.get_policy()
             policies: List[Dict[str, Any]] = []
-            raw_policies = response.get("policies")
 
-            # Validate the structure of the response
-            if not isinstance(raw_policies, list):
-                logger.error(
-                    "Failed to list ISM policies: 'policies' key missing or not a list in response."
-                )
-                raise ValueError("Invalid response format from get_policy API")
-
-            for policy_item in raw_policies:
+            for policy_item in self._get_all_policies():
                 # Basic validation of the policy item structure
                 if not isinstance(policy_item, dict) or "policy" not in policy_item:
                     logger.error(f"Skipping invalid policy item format: {policy_item}")
@@ -159,24 +479,31 @@ class ISMPolicyManager:
                         f"Skipping policy item with invalid 'policy' data type: {policy_item}"
                     )
                     continue
-                policy_name = policy_data.pop("policy_id", policy_item.get("_id"))
+                policy_name = policy_data.get("policy_id", policy_item.get("_id"))
+                if not isinstance(policy_name, str):
+                    logger.error(f"Skipping policy item without a name: {policy_item}")
+                    continue
 
                 # filtering
                 if self._should_ignore(policy_name):
                     continue
-                if pattern and not fnmatch.fnmatch(policy_name, pattern):
+                if pattern_re is not None and pattern_re.match(policy_name) is None:
                     continue
 
                 # drop milliseconds to get standard unix timestamp
                 last_updated_time = policy_data.get("last_updated_time", 0) // 1000
 
-                # cleanup using the helper method
-                self._cleanup_policy_metadata(policy_data)
+                if fields is not None:
+                    policy_info = {"name": policy_name, "last_updated_time": last_updated_time}
+                    if "policy" in fields:
+                        policy_info["policy"] = _strip_policy_metadata(policy_data)
+                    policies.append({field: policy_info[field] for field in fields})
+                    continue
 
                 policies.append(
                     {
                         "name": policy_name,
-                        "policy": policy_data,  # policy_data is now cleaned up from metadata
+                        "policy": _strip_policy_metadata(policy_data),
                         "last_updated_time": last_updated_time,  # top-level, converted to seconds
                     }
                 )
@@ -194,12 +521,18 @@ class ISMPolicyManager:
         """
         policies = self.list_policies(pattern)
         saved_files = []
+        # The saved files match the policies in OpenSearch
+        digests: Dict[str, Optional[str]] = {}
 
         for policy_info in policies:
             name = policy_info["name"]
             policy = policy_info["policy"]
-            saved_files.append(self.save_policy(name, policy))
+            file_path, digest = self._save_policy(name, policy)
+            saved_files.append(file_path)
+            if digest is not None:
+                digests[name] = digest
 
+        self._update_manifest(digests)
         return saved_files
 
     def save_policy(self, name, policy) -> str:
@@ -209,32 +542,78 @@ class ISMPolicyManager:
         :param policy: Policy data to save.
         :return: Path to the policy file.
         """
+        return self._save_policy(name, policy)[0]
+
+    def _save_policy(self, name: str, policy: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+        """Write an ISM policy file and digest its contents.
+
+        :param name: Name of the policy.
+        :param policy: Policy data to save.
+        :return: Tuple of (path to the policy file, digest of its contents or None if
+                 saving failed).
+        """
+        import yaml
+
+        _, yaml_dumper = get_yaml_classes()
         # Create file path
         file_path = os.path.join(self.policies_dir, f"{name}.yaml")
         try:
-            with open(file_path, "w") as f:
-                yaml.dump(policy, f, default_flow_style=False, sort_keys=False)
+            data = yaml.dump(
+                policy,
+                Dumper=yaml_dumper,
+                default_flow_style=False,
+                sort_keys=False,
+                encoding="utf-8",
+            )
+            _write_bytes(file_path, data)
             logger.info(f"Saved ISM policy '{name}' to {file_path}")
         except Exception as e:
             logger.error(f"Failed to save ISM policy '{name}': {e}")
-        return file_path
+            return file_path, None
+        return file_path, _content_digest(data)
 
-    def publish_policy(self, policy_name: str) -> bool:
+    def _get_existing_versions(self) -> Optional[Dict[str, Tuple[int, int]]]:
+        """Fetch sequence numbers of all policies in OpenSearch, a page of policies per request.
+
+        :return: Dictionary mapping policy names to (seq_no, primary_term), or None if
+                 the listing failed.
+        """
+        try:
+            raw_policies = self._get_all_policies()
+        except Exception as e:
+            logger.warning(f"Failed to list existing ISM policies: {e}")
+            return None
+
+        return {
+            item["_id"]: (item["_seq_no"], item["_primary_term"])
+            for item in raw_policies
+            if isinstance(item, dict) and "_id" in item and "_seq_no" in item
+        }
+
+    def publish_policy(
+        self,
+        policy_name: str,
+        policy_file: Optional[str] = None,
+        existing: Optional[Dict[str, Tuple[int, int]]] = None,
+    ) -> bool:
         """Publish an ISM policy from a local file to OpenSearch.
 
-        Finds the policy file based on the name and publishes it.
+        Finds the policy file based on the name, unless it is given, and publishes it.
 
         :param policy_name: Name of the policy (should match the filename without extension).
+        :param policy_file: Optional path to the policy file, skips the file lookup.
+        :param existing: Optional mapping of existing policy names to (seq_no, primary_term),
+                         skips fetching the policy before updating it.
         :return: True if the policy was published successfully, False otherwise.
         """
-        policy_file = self._find_policy_file(policy_name)
+        if policy_file is None:
+            policy_file = self._find_policy_file(policy_name)
         if not policy_file:
             logger.error(f"Could not find policy file for '{policy_name}' in {self.policies_dir}")
             return False
 
         try:
-            with open(policy_file, "r") as f:
-                policy_data = yaml.safe_load(f)
+            policy_data = _load_yaml_cached(policy_file)
 
             if not policy_data or not isinstance(policy_data, dict):
                 logger.error(f"Invalid policy file format: {policy_file}")
@@ -243,21 +622,24 @@ class ISMPolicyManager:
             # Check if the policy already exists to get sequence numbers for update
             seq_no = None
             primary_term = None
-            try:
-                existing_policy = self.ism_client.get_policy(policy=policy_name)
-                seq_no = existing_policy.get("_seq_no")
-                primary_term = existing_policy.get("_primary_term")
-                logger.debug(
-                    f"Policy '{policy_name}' found. Using seq_no={seq_no}, primary_term={primary_term} for update."
-                )
-            except NotFoundError:
-                logger.debug(f"Policy '{policy_name}' not found. Creating new policy.")
-            except Exception as e:
-                logger.warning(
-                    f"Failed to get existing policy '{policy_name}', proceeding without sequence numbers: {e}"
-                )
-                # Decide if we should proceed or fail here. Proceeding might overwrite changes.
-                # For now, let's proceed as if it's a create operation.
+            if existing is not None:
+                seq_no, primary_term = existing.get(policy_name, (None, None))
+            else:
+                try:
+                    existing_policy = self.ism_client.get_policy(policy=policy_name)
+                    seq_no = existing_policy.get("_seq_no")
+                    primary_term = existing_policy.get("_primary_term")
+                    logger.debug(
+                        f"Policy '{policy_name}' found. Using seq_no={seq_no}, primary_term={primary_term} for update."
+                    )
+                except NotFoundError:
+                    logger.debug(f"Policy '{policy_name}' not found. Creating new policy.")
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to get existing policy '{policy_name}', proceeding without sequence numbers: {e}"
+                    )
+                    # Decide if we should proceed or fail here. Proceeding might overwrite changes.
+                    # For now, let's proceed as if it's a create operation.
 
             # Publish the policy using the Index Management client
             if seq_no is not None and primary_term is not None:
@@ -277,29 +659,63 @@ class ISMPolicyManager:
             return False
         return True
 
-    def publish_policies(self, pattern: Optional[str] = None) -> Dict[str, bool]:
+    def publish_policies(
+        self,
+        pattern: Optional[str] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        skip_unchanged: bool = False,
+    ) -> Dict[str, bool]:
         """Publish ISM policies from local files to OpenSearch.
 
+        Policies are published concurrently over the client's connection pool.
+
         :param pattern: Optional pattern to filter policy files.
-        :return: Dictionary mapping policy names to success status.
+        :param max_workers: Maximum number of policies to publish concurrently.
+        :param skip_unchanged: Skip policy files whose contents match what was last saved
+                               from or published to OpenSearch by this tool, and record the
+                               published contents. Changes made in OpenSearch by other means
+                               are not detected.
+        :return: Dictionary mapping policy names to success status. Skipped policies
+                 are left out.
         """
-        results = {}
-        # Get all policy files
-        for file in os.listdir(self.policies_dir):
-            if file.endswith(".yaml"):
-                # Extract policy name from filename
-                policy_name = os.path.splitext(file)[0]
-                if pattern and not fnmatch.fnmatch(policy_name, pattern):
-                    continue
-                # policy_file = os.path.join(self.policies_dir, file) # No longer needed here
-                success = self.publish_policy(policy_name)
-                results[policy_name] = success
+        policy_files = self._scan_policy_files(pattern)
+        if skip_unchanged and policy_files:
+            policy_files = self._drop_unchanged(policy_files)
+        if not policy_files:
+            return {}
+
+        warn_if_pool_too_small(self.env_config, min(max_workers, len(policy_files)))
+        existing = self._get_existing_versions()
+        publish = partial(self.publish_policy, existing=existing)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = dict(
+                zip(policy_files, executor.map(publish, policy_files, policy_files.values()))
+            )
 
+        self._update_manifest(
+            {
+                name: _read_policy_file(path)[1]
+                for name, path in policy_files.items()
+                if results[name]
+            },
+            create=skip_unchanged,
+        )
         return results
 
     def delete_policy(self, policy_name: str) -> bool:
         """Delete an ISM policy from OpenSearch.
 
+        :param policy_name: Name of the policy to delete.
+        :return: True if the policy was deleted, False otherwise.
+        """
+        if not self._delete_policy(policy_name):
+            return False
+        self._update_manifest({policy_name: None})
+        return True
+
+    def _delete_policy(self, policy_name: str) -> bool:
+        """Delete an ISM policy from OpenSearch, leaving the manifest alone.
+
         :param policy_name: Name of the policy to delete.
         :return: True if the policy was deleted, False otherwise.
         """
@@ -311,14 +727,35 @@ class ISMPolicyManager:
             logger.error(f"Failed to delete ISM policy '{policy_name}': {e}")
             return False
 
+    def delete_policies(
+        self, policy_names: Iterable[str], max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> Dict[str, bool]:
+        """Delete several ISM policies from OpenSearch.
+
+        Policies are deleted concurrently over the client's connection pool.
+
+        :param policy_names: Names of the policies to delete.
+        :param max_workers: Maximum number of policies to delete concurrently.
+        :return: Dictionary mapping policy names to success status.
+        """
+        policy_names = list(dict.fromkeys(policy_names))
+        if not policy_names:
+            return {}
+
+        warn_if_pool_too_small(self.env_config, min(max_workers, len(policy_names)))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = dict(zip(policy_names, executor.map(self._delete_policy, policy_names)))
+
+        self._update_manifest({name: None for name, deleted in results.items() if deleted})
+        return results
+
     def diff_policy(self, policy_name: str) -> Optional[Dict[str, Any]]:
         """Compare local policy file with the one in OpenSearch.
 
         :param policy_name: Name of the policy to compare.
         :return: Dictionary with diff information or None if policy doesn't exist remotely.
         """
-        from deepdiff import DeepDiff
-
         # Find the local policy file
         policy_file = self._find_policy_file(policy_name)
 
@@ -328,8 +765,7 @@ class ISMPolicyManager:
 
         # Load local policy
         try:
-            with open(policy_file, "r") as f:
-                local_policy = yaml.safe_load(f)
+            local_policy = _load_yaml_cached(policy_file)
 
             if not local_policy or not isinstance(local_policy, dict):
                 logger.error(f"Invalid local policy file format: {policy_file}")
@@ -345,15 +781,13 @@ class ISMPolicyManager:
                 logger.error(f"Invalid response format from get_policy API for '{policy_name}'")
                 return None
 
-            remote_policy = remote_response.get("policy", {})
-
             # cleanup metadata from remote policy for comparison using the helper method
-            self._cleanup_policy_metadata(remote_policy)
+            remote_policy = _strip_policy_metadata(remote_response.get("policy", {}))
 
             # Get the diff
-            diff = DeepDiff(remote_policy, local_policy, ignore_order=True)
+            diff = _policy_diff(remote_policy, local_policy)
 
-            if not diff:
+            if diff is None:
                 return {"has_changes": False}
 
             return {
@@ -2,47 +2,76 @@
 Template management module for OpenSearch.
 """
 
-import fnmatch
 import logging
 import os
-from typing import Dict, Any, List, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, Any, List, Optional, Tuple
 
-import yaml
 from opensearchpy import OpenSearch
+from opensearchpy.exceptions import NotFoundError
 
-from opensearch_keeper.auth import get_connection_params
+from opensearch_keeper.auth import get_shared_client, warn_if_pool_too_small
+from opensearch_keeper.utils import DEFAULT_MAX_WORKERS, compile_patterns, get_yaml_classes
 
 logger = logging.getLogger(__name__)
 
+TEMPLATE_FILE_EXTENSIONS = (".yaml", ".yml")
+# Same extensions without the dot, for checking the part after a file name's last dot
+_TEMPLATE_FILE_SUFFIXES = frozenset(extension[1:] for extension in TEMPLATE_FILE_EXTENSIONS)
+
+# Glob syntax OpenSearch doesn't understand in template names, besides the comma separator.
+# A leading '-' is also filtered client-side, OpenSearch reads it as an exclusion.
+_CLIENT_SIDE_PATTERN_CHARS = frozenset("?[],")
+
+# Seconds for which a listing of all templates is reused
+TEMPLATES_CACHE_TTL = 5.0
+
+# Write buffer for saved template files, large enough for most mappings in one write
+SAVE_BUFFER_SIZE = 1 << 20
+
 
 class TemplateManager:
     """Manager for OpenSearch index templates."""
 
-    def __init__(self, env_config: Dict[str, Any], templates_dir: str, ignore_patterns: List[str]):
+    def __init__(
+        self,
+        env_config: Dict[str, Any],
+        templates_dir: str,
+        ignore_patterns: List[str],
+        verify_connection: bool = False,
+    ):
         """Initialize the template manager.
 
         :param env_config: Environment configuration.
         :param templates_dir: Directory where templates will be saved.
         :param ignore_patterns: List of template name patterns to ignore.
+        :param verify_connection: Test the connection when creating the client. Otherwise
+                                  connection errors surface on the first API call.
         """
         self.env_config = env_config
         self.templates_dir = templates_dir
         self.ignore_patterns = ignore_patterns
-        self.client = self._create_client()
+        self._ignore_re = compile_patterns(ignore_patterns)
+        # (fetch time, 'index_templates' items) of the last listing of all templates
+        self._templates_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+        self.client = self._create_client(verify_connection)
 
-    def _create_client(self) -> OpenSearch:
-        """Create an OpenSearch client.
+    def _create_client(self, verify_connection: bool = False) -> OpenSearch:
+        """Get the OpenSearch client for the environment, shared with other managers.
 
+        :param verify_connection: Test the connection with an extra round-trip.
         :return: OpenSearch client.
         """
-        connection_params = get_connection_params(self.env_config)
         try:
-            client = OpenSearch(**connection_params)
-            # Test the connection
-            client.info()
-            logger.info(
-                f"Connected to OpenSearch at {self.env_config['host']}:{self.env_config['port']}"
-            )
+            client = get_shared_client(self.env_config, OpenSearch)
+            address = f"{self.env_config['host']}:{self.env_config['port']}"
+            if verify_connection:
+                client.info()
+                logger.info(f"Connected to OpenSearch at {address}")
+            else:
+                logger.debug(f"Using OpenSearch client for {address}")
             return client
         except Exception as e:
             logger.error(f"Failed to connect to OpenSearch: {e}")
@@ -54,65 +83,123 @@ class TemplateManager:
         :param template_name: Name of the template.
         :return: True if the template should be ignored, False otherwise.
         """
-        for pattern in self.ignore_patterns:
-            if fnmatch.fnmatch(template_name, pattern):
-                return True
-        return False
+        return self._ignore_re is not None and self._ignore_re.match(template_name) is not None
+
+    def _get_templates(self, pattern: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get index templates, reusing a listing fetched within the last few seconds.
+
+        Without a fresh listing, patterns using only '*' wildcards are passed to OpenSearch,
+        so only matching templates are transferred. Other patterns need a full listing.
+
+        :param pattern: Optional pattern the caller will filter the templates by.
+        :return: List of 'index_templates' items from the API response, a superset of the
+                 templates matching the pattern.
+        """
+        cached = self._templates_cache
+        if cached is not None and time.monotonic() - cached[0] < TEMPLATES_CACHE_TTL:
+            return cached[1]
+
+        if (
+            pattern
+            and pattern != "*"
+            and not pattern.startswith("-")
+            and not _CLIENT_SIDE_PATTERN_CHARS.intersection(pattern)
+        ):
+            try:
+                response = self.client.indices.get_index_template(name=pattern)
+            except NotFoundError:
+                # Raised when a pattern without wildcards names a missing template
+                return []
+            return response["index_templates"]
+
+        # Get all templates using the new index template API
+        fetched_at = time.monotonic()
+        response = self.client.indices.get_index_template(name="*")
+        # The new API response is different - it contains an 'index_templates' array
+        # Each item has 'name' and 'index_template' fields
+        template_items = response["index_templates"]
+        self._templates_cache = (fetched_at, template_items)
+        return template_items
+
+    def _invalidate_templates_cache(self) -> None:
+        """Forget the cached listing after templates were changed in OpenSearch."""
+        self._templates_cache = None
 
     def list_templates(self, pattern: Optional[str] = None) -> List[Dict[str, Any]]:
         """List templates in OpenSearch.
 
+        Listings are reused for a few seconds, the returned templates must not be modified.
+
         :param pattern: Optional pattern to filter templates.
         :return: List of templates.
         """
         try:
-            # Get all templates using the new index template API
-            response = self.client.indices.get_index_template(name="*")
+            pattern_re = compile_patterns([pattern]) if pattern else None
 
-            # Filter templates
-            templates = []
+            # Filter templates in a single pass, with the matchers bound outside the loop
+            ignore_match = self._ignore_re.match if self._ignore_re is not None else None
+            pattern_match = pattern_re.match if pattern_re is not None else None
+            templates: List[Dict[str, Any]] = []
+            append = templates.append
 
-            # The new API response is different - it contains an 'index_templates' array
-            # Each item has 'name' and 'index_template' fields
-            for template_item in response["index_templates"]:
+            for template_item in self._get_templates(pattern):
                 name = template_item["name"]
-                template = template_item["index_template"]
-
-                if self._should_ignore(name):
+                if ignore_match is not None and ignore_match(name):
                     continue
-                if pattern and not fnmatch.fnmatch(name, pattern):
+                if pattern_match is not None and not pattern_match(name):
                     continue
-                templates.append({"name": name, "template": template})
+                append({"name": name, "template": template_item["index_template"]})
             return templates
         except Exception as e:
             logger.error(f"Failed to list templates: {e}")
             raise
 
-    def save_templates(self, pattern: Optional[str] = None) -> List[str]:
+    def _save_template(self, template_info: Dict[str, Any], yaml_dumper: Any) -> Optional[str]:
+        """Save a single template to a local file.
+
+        :param template_info: Dictionary with the template 'name' and 'template' definition.
+        :param yaml_dumper: YAML dumper class.
+        :return: Path to the saved template file, or None if saving failed.
+        """
+        import yaml
+
+        name = template_info["name"]
+        template = template_info["template"]
+
+        # Create file path
+        file_path = os.path.join(self.templates_dir, f"{name}.yaml")
+
+        try:
+            # Stream the dump through a large buffer rather than building it in memory
+            with open(file_path, "w", buffering=SAVE_BUFFER_SIZE) as f:
+                yaml.dump(
+                    template, f, Dumper=yaml_dumper, default_flow_style=False, sort_keys=False
+                )
+            logger.info(f"Saved template '{name}' to {file_path}")
+            return file_path
+        except Exception as e:
+            logger.error(f"Failed to save template '{name}': {e}")
+            return None
+
+    def save_templates(
+        self, pattern: Optional[str] = None, max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> List[str]:
         """Save templates from OpenSearch to local files.
 
+        Templates are serialized and written concurrently.
+
         :param pattern: Optional pattern to filter templates.
+        :param max_workers: Maximum number of templates to save concurrently.
         :return: List of saved template file paths.
         """
         templates = self.list_templates(pattern)
-        saved_files = []
-
-        for template_info in templates:
-            name = template_info["name"]
-            template = template_info["template"]
+        if not templates:
+            return []
 
-            # Create file path
-            file_path = os.path.join(self.templates_dir, f"{name}.yaml")
-
-            try:
-                with open(file_path, "w") as f:
-                    yaml.dump(template, f, default_flow_style=False)
-                logger.info(f"Saved template '{name}' to {file_path}")
-                saved_files.append(file_path)
-            except Exception as e:
-                logger.error(f"Failed to save template '{name}': {e}")
-
-        return saved_files
+        _, yaml_dumper = get_yaml_classes()
+        save = partial(self._save_template, yaml_dumper=yaml_dumper)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return [file_path for file_path in executor.map(save, templates) if file_path]
 
     def publish_template(self, template_name: str, template_file: str) -> bool:
         """Publish a template from a local file to OpenSearch.
@@ -121,9 +208,12 @@ class TemplateManager:
         :param template_file: Path to the template file.
         :return: True if the template was published successfully, False otherwise.
         """
+        import yaml
+
         try:
-            with open(template_file, "r") as f:
-                template_data = yaml.safe_load(f)
+            yaml_loader, _ = get_yaml_classes()
+            with open(template_file, "rb") as f:
+                template_data = yaml.load(f, Loader=yaml_loader)
 
             if not template_data or not isinstance(template_data, dict):
                 logger.error(f"Invalid template file format: {template_file}")
@@ -137,31 +227,60 @@ class TemplateManager:
 
             # Publish the template using the new index template API
             self.client.indices.put_index_template(name=template_name, body=template_data)
+            self._invalidate_templates_cache()
             logger.info(f"Published template '{template_name}' to OpenSearch")
             return True
         except Exception as e:
             logger.error(f"Failed to publish template '{template_name}': {e}")
             return False
 
-    def publish_templates(self, pattern: Optional[str] = None) -> Dict[str, bool]:
+    def _scan_template_files(self, pattern: Optional[str] = None) -> Dict[str, str]:
+        """Map local template names to their file paths in a single directory pass.
+
+        :param pattern: Optional fnmatch pattern to filter template names.
+        :return: Dictionary mapping template names to template file paths.
+        """
+        pattern_re = compile_patterns([pattern]) if pattern else None
+        template_files = {}
+        with os.scandir(self.templates_dir) as entries:
+            for entry in entries:
+                template_name, dot, suffix = entry.name.rpartition(".")
+                if not dot or suffix not in _TEMPLATE_FILE_SUFFIXES or not entry.is_file():
+                    continue
+                if pattern_re is not None and pattern_re.match(template_name) is None:
+                    continue
+                if template_name in template_files:
+                    # Prefer the .yaml file, which is what saving writes, whatever the listing order
+                    logger.warning(
+                        f"Both {template_name}.yaml and {template_name}.yml exist in "
+                        f"{self.templates_dir}, using {template_name}.yaml"
+                    )
+                    if suffix != "yaml":
+                        continue
+                template_files[template_name] = entry.path
+        return template_files
+
+    def publish_templates(
+        self, pattern: Optional[str] = None, max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> Dict[str, bool]:
         """Publish templates from local files to OpenSearch.
 
+        Templates are published concurrently over the client's connection pool.
+
         :param pattern: Optional pattern to filter template files.
+        :param max_workers: Maximum number of templates to publish concurrently.
         :return: Dictionary mapping template names to success status.
         """
-        results = {}
-        # Get all template files
-        for file in os.listdir(self.templates_dir):
-            if file.endswith(".yaml"):
-                # Extract template name from filename
-                template_name = os.path.splitext(file)[0]
-                if pattern and not fnmatch.fnmatch(template_name, pattern):
-                    continue
-                template_file = os.path.join(self.templates_dir, file)
-                success = self.publish_template(template_name, template_file)
-                results[template_name] = success
-
-        return results
+        template_files = self._scan_template_files(pattern)
+        if not template_files:
+            return {}
+
+        warn_if_pool_too_small(self.env_config, min(max_workers, len(template_files)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            successes = executor.map(
+                self.publish_template, template_files.keys(), template_files.values()
+            )
+            return dict(zip(template_files, successes))
 
     def delete_template(self, template_name: str) -> bool:
         """Delete a template from OpenSearch.
@@ -171,6 +290,7 @@ class TemplateManager:
         """
         try:
             self.client.indices.delete_index_template(name=template_name)
+            self._invalidate_templates_cache()
             logger.info(f"Deleted template '{template_name}' from OpenSearch")
             return True
         except Exception as e:
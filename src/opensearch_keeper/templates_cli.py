@@ -0,0 +1,115 @@
+"""
+Command-line interface for managing OpenSearch index templates.
+"""
+
+import logging
+import sys
+from typing import Optional
+
+import typer
+
+from opensearch_keeper.cli import (
+    get_config,
+    get_template_manager,
+    make_delete_command,
+    make_save_command,
+)
+from opensearch_keeper.utils import DEFAULT_MAX_WORKERS, write_template_list
+
+logger = logging.getLogger(__name__)
+
+app = typer.Typer(help="Manage OpenSearch index templates.")
+
+
+@app.command("list")
+def list_templates(
+    env: str = typer.Option(..., "--env", "-e", help="Environment to use (qa, prod, etc.)."),
+    pattern: Optional[str] = typer.Option(
+        None, "--pattern", "-p", help="Pattern to filter templates."
+    ),
+    format: str = typer.Option(
+        "table",
+        "--format",
+        "-f",
+        help="Output format (table, json, yaml).",
+        show_choices=True,
+        case_sensitive=False,
+    ),
+):
+    """List templates in OpenSearch.
+
+    :param env: Environment to use (qa, prod, etc.).
+    :param pattern: Pattern to filter templates.
+    :param format: Output format (table, json, yaml).
+    """
+    config = get_config()
+    template_manager = get_template_manager(config, env)
+
+    try:
+        templates = template_manager.list_templates(pattern)
+        write_template_list(templates, sys.stdout, format)
+    except Exception as e:
+        logger.error(f"Failed to list templates: {e}")
+        sys.exit(1)
+
+
+save_templates = app.command("save", help="Save templates from OpenSearch to local files.")(
+    make_save_command(
+        get_template_manager,
+        "save_templates",
+        "templates_dir",
+        "templates",
+        "Pattern to filter templates.",
+    )
+)
+
+
+@app.command("publish")
+def publish_templates(
+    env: str = typer.Option(..., "--env", "-e", help="Environment to use (qa, prod, etc.)."),
+    pattern: Optional[str] = typer.Option(
+        None, "--pattern", "-p", help="Pattern to filter templates."
+    ),
+    parallel: int = typer.Option(
+        DEFAULT_MAX_WORKERS,
+        "--parallel",
+        "-j",
+        min=1,
+        help="Number of templates to publish concurrently.",
+    ),
+):
+    """Publish templates from local files to OpenSearch.
+
+    :param env: Environment to use (qa, prod, etc.).
+    :param pattern: Pattern to filter templates.
+    :param parallel: Number of templates to publish concurrently.
+    """
+    config = get_config()
+    template_manager = get_template_manager(config, env)
+
+    try:
+        results = template_manager.publish_templates(pattern, max_workers=parallel)
+
+        if not results:
+            typer.echo("No templates were published.")
+            return
+
+        failed = [name for name, success in results.items() if not success]
+        success_count = len(results) - len(failed)
+
+        typer.echo(f"Published {success_count} templates to OpenSearch")
+        if failed:
+            typer.echo(f"Failed to publish {len(failed)} templates")
+
+            # Show failed templates
+            typer.echo("\nFailed templates:")
+            for name in failed:
+                typer.echo(f"- {name}")
+    except Exception as e:
+        logger.error(f"Failed to publish templates: {e}")
+        sys.exit(1)
+
+
+delete_template = app.command("delete", help="Delete a template from OpenSearch.")(
+    make_delete_command(get_template_manager, "delete_template", "template", "TEMPLATE_NAME")
+)
@@ -2,9 +2,17 @@
 Utility functions for opensearch-keeper.
 """
 
+import fnmatch
+import io
 import logging
+import re
 import sys
-from typing import List, Dict, Any
+import time
+from functools import lru_cache, partial
+from typing import Callable, Iterable, List, Dict, Any, Optional, Pattern, TextIO, Tuple
+
+# Default number of concurrent requests for bulk publish operations
+DEFAULT_MAX_WORKERS = 8
 
 
 def setup_logging(verbose: bool = False) -> None:
@@ -20,31 +28,138 @@ def setup_logging(verbose: bool = False) -> None:
     )
 
 
-def format_template_list(templates: List[Dict[str, Any]], output_format: str = "table") -> str:
-    """Format a list of templates for display.
+def compile_patterns(patterns: Iterable[str]) -> Optional[Pattern[str]]:
+    """Compile shell-style wildcard patterns into a single regular expression.
 
-    :param templates: List of template dictionaries.
-    :param output_format: Output format ('table', 'json', or 'yaml').
-    :return: Formatted string representation of templates.
+    :param patterns: Wildcard patterns as accepted by fnmatch.
+    :return: Compiled regular expression matching any of the patterns,
+             or None if there are no patterns.
     """
-    if output_format == "json":
+    translated = [f"(?:{fnmatch.translate(pattern)})" for pattern in patterns]
+    if not translated:
+        return None
+    return re.compile("|".join(translated))
+
+
+@lru_cache(maxsize=None)
+def get_yaml_classes() -> Tuple[Any, Any]:
+    """Get the safe YAML loader and dumper classes, preferring the libyaml bindings.
+
+    PyYAML is imported on first use, so commands that don't read or write YAML
+    don't pay for it at startup.
+
+    :return: Tuple of (loader class, dumper class).
+    """
+    try:
+        from yaml import CSafeDumper as YamlDumper, CSafeLoader as YamlLoader
+    except ImportError:
+        from yaml import SafeDumper as YamlDumper, SafeLoader as YamlLoader  # type: ignore[assignment]
+    return YamlLoader, YamlDumper
+
+
+@lru_cache(maxsize=None)
+def get_json_dumps() -> Callable[[Any], str]:
+    """Get a function serializing objects to indented JSON, preferring orjson.
+
+    The JSON library is imported on first use. Non-ASCII characters are written as is
+    rather than escaped.
+
+    :return: Function taking an object and returning its JSON representation.
+    """
+    try:
+        import orjson
+    except ImportError:
         import json
 
-        return json.dumps([t["name"] for t in templates], indent=2)
+        return partial(json.dumps, indent=2, ensure_ascii=False)
+
+    def dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+    return dumps
+
+
+def format_timestamp(timestamp: int) -> str:
+    """Format a unix timestamp as a UTC 'YYYY-MM-DD HH:MM:SS' string.
+
+    :param timestamp: Unix timestamp in seconds.
+    :return: Formatted UTC date and time.
+    """
+    t = time.gmtime(timestamp)
+    return "%04d-%02d-%02d %02d:%02d:%02d" % (
+        t.tm_year,
+        t.tm_mon,
+        t.tm_mday,
+        t.tm_hour,
+        t.tm_min,
+        t.tm_sec,
+    )
+
+
+def _write_name_list(
+    items: List[Dict[str, Any]], out: TextIO, output_format: str, title: str, empty_message: str
+) -> None:
+    """Write the names of a list of items to a stream.
+
+    :param items: List of dictionaries with a 'name' key.
+    :param out: Stream to write to.
+    :param output_format: Output format ('table', 'json', or 'yaml').
+    :param title: Heading for the table format.
+    :param empty_message: Message for the table format when there are no items.
+    """
+    if output_format == "json":
+        out.write(get_json_dumps()([i["name"] for i in items]))
+        out.write("\n")
 
     elif output_format == "yaml":
         import yaml
 
-        return yaml.dump([t["name"] for t in templates], default_flow_style=False)
+        _, yaml_dumper = get_yaml_classes()
+        yaml.dump([i["name"] for i in items], out, Dumper=yaml_dumper, default_flow_style=False)
 
     else:  # table format
-        if not templates:
-            return "No templates found."
+        if not items:
+            out.write(f"{empty_message}\n")
+            return
 
-        result = "Templates:\n"
-        for template in templates:
-            result += f"- {template['name']}\n"
-        return result
+        out.write(f"{title}:\n")
+        out.write("".join(f"- {item['name']}\n" for item in items))
+
+
+def write_template_list(
+    templates: List[Dict[str, Any]], out: TextIO, output_format: str = "table"
+) -> None:
+    """Write a list of templates to a stream without building the whole output first.
+
+    :param templates: List of template dictionaries.
+    :param out: Stream to write to.
+    :param output_format: Output format ('table', 'json', or 'yaml').
+    """
+    _write_name_list(templates, out, output_format, "Templates", "No templates found.")
+
+
+def write_policy_list(
+    policies: List[Dict[str, Any]], out: TextIO, output_format: str = "table"
+) -> None:
+    """Write a list of ISM policies to a stream without building the whole output first.
+
+    :param policies: List of policy dictionaries.
+    :param out: Stream to write to.
+    :param output_format: Output format ('table', 'json', or 'yaml').
+    """
+    _write_name_list(policies, out, output_format, "ISM Policies", "No ISM policies found.")
+
+
+def format_template_list(templates: List[Dict[str, Any]], output_format: str = "table") -> str:
+    """Format a list of templates for display.
+
+    :param templates: List of template dictionaries.
+    :param output_format: Output format ('table', 'json', or 'yaml').
+    :return: Formatted string representation of templates.
+    """
+    out = io.StringIO()
+    write_template_list(templates, out, output_format)
+    return out.getvalue()
 
 
 def format_policy_list(policies: List[Dict[str, Any]], output_format: str = "table") -> str:
@@ -54,21 +169,21 @@ def format_policy_list(policies: List[Dict[str, Any]], output_format: str = "tab
     :param output_format: Output format ('table', 'json', or 'yaml').
     :return: Formatted string representation of policies.
     """
-    if output_format == "json":
-        import json
+    out = io.StringIO()
+    write_policy_list(policies, out, output_format)
+    return out.getvalue()
 
-        return json.dumps([p["name"] for p in policies], indent=2)
 
-    elif output_format == "yaml":
-        import yaml
+def format_policy_diff(diff: Dict[str, Dict[str, Any]]) -> str:
+    """Format the differences between a remote and a local ISM policy for display.
 
-        return yaml.dump([p["name"] for p in policies], default_flow_style=False)
-
-    else:  # table format
-        if not policies:
-            return "No ISM policies found."
-
-        result = "ISM Policies:\n"
-        for policy in policies:
-            result += f"- {policy['name']}\n"
-        return result
+    :param diff: Dictionary with 'added', 'removed' and 'changed' entries keyed by path.
+    :return: One line per difference.
+    """
+    lines = [f"Item {path} added with value {value!r}." for path, value in diff["added"].items()]
+    lines.extend(f"Item {path} removed, was {value!r}." for path, value in diff["removed"].items())
+    lines.extend(
+        f"Value of {path} changed from {old!r} to {new!r}."
+        for path, (old, new) in diff["changed"].items()
+    )
+    return "\n".join(lines)
@@ -0,0 +1,145 @@
+"""
+Tests for the command-line interface.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+import yaml
+from unittest.mock import MagicMock, patch
+from typer.testing import CliRunner
+
+from opensearch_keeper import cli
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    """Create a configuration file and reset the CLI's cached state."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setattr(cli, "config_instance", None)
+
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        yaml.dump(
+            {
+                "environments": {
+                    "staging": {"host": "localhost", "port": 9200},
+                },
+                "storage_dir": str(tmp_path / "dump"),
+            }
+        )
+    )
+    return str(config_path)
+
+
+def test_commands_use_config_option(config_file):
+    """Test that commands see the configuration passed to --config."""
+    result = CliRunner().invoke(cli.app, ["--config", config_file, "environments"])
+
+    assert result.exit_code == 0
+    assert "staging" in result.output
+    assert cli.get_config().config_path == config_file
+
+
+def test_managers_are_shared(config_file):
+    """Test that managers are created once per environment and share one client."""
+    cli.get_template_manager.cache_clear()
+    cli.get_ism_policy_manager.cache_clear()
+    client_class = MagicMock()
+    with patch("opensearch_keeper.template_manager.OpenSearch", client_class), patch(
+        "opensearch_keeper.ism_policy_manager.OpenSearch", client_class
+    ):
+        config = cli.get_config(config_file)
+        template_manager = cli.get_template_manager(config, "staging")
+        policy_manager = cli.get_ism_policy_manager(config, "staging")
+
+        assert cli.get_template_manager(config, "staging") is template_manager
+        assert cli.get_ism_policy_manager(config, "staging") is policy_manager
+    assert template_manager.client is policy_manager.client
+    client_class.assert_called_once()
+
+    cli.get_template_manager.cache_clear()
+    cli.get_ism_policy_manager.cache_clear()
+
+
+def test_module_run_uses_config_option(tmp_path):
+    """Test that subcommands run with 'python -m opensearch_keeper.cli' see --config."""
+    config_path = tmp_path / "alt.yaml"
+    config_path.write_text(
+        yaml.dump(
+            {
+                # Nothing listens on port 1, so the command fails fast after using the config
+                "environments": {"alt": {"host": "127.0.0.1", "port": 1}},
+                "storage_dir": str(tmp_path / "dump"),
+            }
+        )
+    )
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "opensearch_keeper.cli",
+            "-c",
+            str(config_path),
+            "templates",
+            "save",
+            "--env",
+            "alt",
+        ],
+        capture_output=True,
+        text=True,
+        cwd=tmp_path,
+        env={**os.environ, "XDG_CACHE_HOME": str(tmp_path / "cache")},
+    )
+
+    assert "Environment 'alt' not found" not in result.stdout
+    assert "Failed to save templates" in result.stdout
+
+
+def test_publish_policies_skip_unchanged(config_file):
+    """Test that publishing ISM policies with --skip-unchanged records the published files."""
+    cli.register_subcommands(["ism-policies"])
+    manager = MagicMock(env_config={})
+    manager.list_local_policies_names.return_value = ["new", "same"]
+    manager.diff_policy.side_effect = lambda name: None if name == "new" else {"has_changes": False}
+    manager.publish_policy.return_value = True
+
+    args = ["--config", config_file, "ism-policies", "publish", "-e", "staging", "--skip-unchanged"]
+    with patch("opensearch_keeper.ism_policies_cli.get_ism_policy_manager", return_value=manager):
+        result = CliRunner().invoke(cli.app, args)
+
+    assert result.exit_code == 0
+    manager.list_local_policies_names.assert_called_once_with(None, True)
+    manager.record_published_policies.assert_called_once_with(["new", "same"], create=True)
+
+
+@pytest.mark.parametrize(
+    "args, expected",
+    [
+        ([], None),
+        (["--help"], None),
+        (["templates", "list", "-e", "qa"], "templates"),
+        (["-c", "config.yaml", "ism-policies", "list"], "ism-policies"),
+        (["--config", "config.yaml", "-v", "environments"], "environments"),
+        (["--config=config.yaml", "templates"], "templates"),
+    ],
+)
+def test_find_subcommand(args, expected):
+    """Test finding the subcommand name in command-line arguments."""
+    assert cli._find_subcommand(args) == expected
+
+
+def test_import_skips_heavy_modules():
+    """Test that importing the CLI and the managers doesn't load YAML."""
+    code = (
+        "import sys\n"
+        "import opensearch_keeper.cli, opensearch_keeper.ism_policy_manager\n"
+        "import opensearch_keeper.template_manager\n"
+        "print('yaml' in sys.modules)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
@@ -6,8 +6,16 @@ import os
 import tempfile
 import pytest
 import yaml
+from unittest.mock import patch
 
-from opensearch_keeper.config import Config
+from opensearch_keeper.config import Config, get_cache_dir
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Keep the configuration cache inside a temporary directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    return get_cache_dir()
 
 
 @pytest.fixture
@@ -79,6 +87,30 @@ def test_get_templates_dir(sample_config):
     assert templates_dir.endswith("/dump/qa/templates")
 
 
+def test_get_templates_dir_creates_once(sample_config):
+    """Test that directories are created only on the first call."""
+    config = Config(sample_config)
+    with patch("opensearch_keeper.config.os.path.isdir", return_value=False), patch(
+        "opensearch_keeper.config.Path.mkdir"
+    ) as mock_mkdir:
+        config.get_templates_dir("qa")
+        config.get_templates_dir("qa")
+        # storage dir and templates dir are created once each
+        assert mock_mkdir.call_count == 2
+
+        config.get_ism_policies_dir("qa")
+        config.get_ism_policies_dir("qa")
+        assert mock_mkdir.call_count == 3
+
+
+def test_ensure_dir_skips_existing(sample_config, tmp_path):
+    """Test that existing directories are not created again."""
+    config = Config(sample_config)
+    with patch("opensearch_keeper.config.Path.mkdir") as mock_mkdir:
+        config._ensure_dir(str(tmp_path))
+    mock_mkdir.assert_not_called()
+
+
 def test_get_ism_policies_dir(sample_config):
     """Test getting ISM policies directory."""
     config = Config(sample_config)
@@ -100,3 +132,71 @@ def test_get_available_environments(sample_config):
     config = Config(sample_config)
     environments = config.get_available_environments()
     assert sorted(environments) == ["prod", "qa"]
+
+
+def test_load_config_uses_cache(sample_config, cache_dir):
+    """Test that a second load reads the parsed configuration from the cache."""
+    Config(sample_config)
+    assert len(list(cache_dir.glob("*.pkl"))) == 1
+
+    with patch("yaml.load") as mock_load:
+        config = Config(sample_config)
+    mock_load.assert_not_called()
+    assert sorted(config.get_available_environments()) == ["prod", "qa"]
+
+
+def test_load_config_cache_invalidated_on_change(sample_config):
+    """Test that modifying the configuration file invalidates the cache."""
+    Config(sample_config)
+
+    with open(sample_config, "w") as f:
+        yaml.dump({"environments": {"dev": {"host": "localhost", "port": 9200}}}, f)
+    stat = os.stat(sample_config)
+    os.utime(sample_config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    config = Config(sample_config)
+    assert config.get_available_environments() == ["dev"]
+
+
+def test_load_config_cache_drops_stale_entries(sample_config, cache_dir):
+    """Test that rewriting the cache removes entries for older file versions."""
+    Config(sample_config)
+    stat = os.stat(sample_config)
+    os.utime(sample_config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    Config(sample_config)
+
+    assert len(list(cache_dir.glob("*.pkl"))) == 1
+
+
+def test_load_config_from_default_paths(sample_config, tmp_path, monkeypatch):
+    """Test that the first existing default path is loaded."""
+    missing = str(tmp_path / "missing.yaml")
+    monkeypatch.setattr("opensearch_keeper.config._EXPANDED_CONFIG_PATHS", (missing, sample_config))
+    config = Config()
+    assert config.config_path == sample_config
+
+    monkeypatch.setattr("opensearch_keeper.config._EXPANDED_CONFIG_PATHS", (missing,))
+    config = Config()
+    assert config.config_path is None
+    assert config.config_data == {}
+    assert config.get_available_environments() == []
+    assert config.get_ignore_patterns() == []
+
+
+def test_load_config_missing_file(tmp_path):
+    """Test that an explicit missing configuration file raises FileNotFoundError."""
+    with pytest.raises(FileNotFoundError):
+        Config(str(tmp_path / "missing.yaml"))
+
+
+def test_settings_with_empty_sections(tmp_path):
+    """Test that empty configuration sections fall back to defaults."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("environments:\nignore_patterns:\n")
+    config = Config(str(config_path))
+
+    assert config.get_available_environments() == []
+    assert config.get_ignore_patterns() == []
+    assert config.storage_dir == "./dump"
+    with pytest.raises(ValueError, match="Available environments: \\[\\]"):
+        config.get_environment_config("qa")
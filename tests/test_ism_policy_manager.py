@@ -6,10 +6,17 @@ import os
 import tempfile
 import pytest
 import yaml
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 
 from opensearchpy.exceptions import NotFoundError
-from opensearch_keeper.ism_policy_manager import ISMPolicyManager
+from opensearch_keeper.ism_policy_manager import (
+    MANIFEST_FILENAME,
+    POLICY_PAGE_SIZE,
+    ISMPolicyManager,
+    _load_yaml_cached,
+    _policy_diff,
+    _strip_policy_metadata,
+)
 
 
 @pytest.fixture
@@ -82,6 +89,16 @@ def policy_manager(mock_opensearch):
         yield manager
 
 
+def test_create_client_skips_info_by_default(policy_manager, mock_opensearch):
+    """Test that the connection is only tested when requested."""
+    mock_opensearch.return_value.info.assert_not_called()
+
+    ISMPolicyManager(
+        policy_manager.env_config, policy_manager.policies_dir, [], verify_connection=True
+    )
+    mock_opensearch.return_value.info.assert_called_once_with()
+
+
 def test_list_policies(policy_manager):
     """Test listing ISM policies."""
     policies = policy_manager.list_policies()
@@ -103,6 +120,41 @@ def test_list_policies_with_pattern(policy_manager):
     # Should return only policy1
     assert len(policies) == 1
     assert policies[0]["name"] == "policy1"
+    # Server-maintained metadata is stripped from the policy definition
+    assert not {"policy_id", "last_updated_time"} & policies[0]["policy"].keys()
+
+
+def test_list_policies_skips_unnamed(policy_manager):
+    """Test that policies without a name are skipped instead of failing the listing."""
+    policy_manager.ism_client.get_policy.return_value["policies"].append(
+        {"policy": {"description": "No name", "states": []}}
+    )
+
+    policies = policy_manager.list_policies()
+
+    assert [policy["name"] for policy in policies] == ["policy1", "policy2"]
+
+
+def test_list_policies_pages_through_all(policy_manager):
+    """Test that policies beyond the first page are listed and saved."""
+    stored = [
+        {"_id": f"policy{i:02}", "policy": {"policy_id": f"policy{i:02}", "states": []}}
+        for i in range(25)
+    ]
+
+    def get_policy(params):
+        start = params["from"]
+        return {
+            "policies": stored[start : start + params["size"]],
+            "total_policies": len(stored),
+        }
+
+    policy_manager.ism_client.get_policy.side_effect = get_policy
+
+    with patch("opensearch_keeper.ism_policy_manager.POLICY_PAGE_SIZE", 20):
+        assert len(policy_manager.list_policies()) == 25
+        assert len(policy_manager.save_policies()) == 25
+    assert policy_manager.ism_client.get_policy.call_count == 4
 
 
 def test_save_policies(policy_manager):
@@ -118,6 +170,18 @@ def test_save_policies(policy_manager):
     assert "policy2.yaml" in file_names
 
 
+def test_save_policy_round_trip(policy_manager):
+    """Test that a saved policy file keeps key order and loads back unchanged."""
+    policy = {"description": "Zed first", "default_state": "hot", "states": []}
+
+    file_path = policy_manager.save_policy("policy1", policy)
+
+    with open(file_path) as f:
+        content = f.read()
+    assert content.startswith("description: Zed first\n")
+    assert yaml.safe_load(content) == policy
+
+
 def test_publish_policy_create(policy_manager):
     """Test publishing a new ISM policy."""
     # Mock get_policy to raise NotFoundError (policy doesn't exist)
@@ -205,3 +269,292 @@ def test_delete_policy(policy_manager):
 
     # Verify that the delete_policy method was called with the correct arguments
     policy_manager.ism_client.delete_policy.assert_called_once_with(policy="policy1")
+
+
+def test_delete_policies(policy_manager):
+    """Test deleting several ISM policies concurrently."""
+
+    def delete_policy(policy):
+        if policy == "missing":
+            raise NotFoundError(404, "Not Found", {})
+
+    policy_manager.ism_client.delete_policy.side_effect = delete_policy
+
+    results = policy_manager.delete_policies(["policy1", "missing", "policy2", "policy1"], 2)
+
+    assert results == {"policy1": True, "missing": False, "policy2": True}
+    assert policy_manager.ism_client.delete_policy.call_count == 3
+    assert policy_manager.delete_policies([]) == {}
+
+
+def test_list_policies_with_fields(policy_manager):
+    """Test listing ISM policies projected to a subset of fields."""
+    policies = policy_manager.list_policies(fields=("name", "last_updated_time"))
+
+    assert policies == [
+        {"name": "policy1", "last_updated_time": 1727172147},
+        {"name": "policy2", "last_updated_time": 1727172147},
+    ]
+
+
+def test_publish_policies(policy_manager):
+    """Test publishing several ISM policies concurrently."""
+    policy_manager.ism_client.get_policy.side_effect = NotFoundError(404, "Not Found", {})
+    for name in ("policy_a", "policy_b", "other"):
+        with open(os.path.join(policy_manager.policies_dir, f"{name}.yaml"), "w") as f:
+            yaml.dump({"default_state": "hot", "states": []}, f)
+
+    results = policy_manager.publish_policies("policy_*", max_workers=2)
+
+    assert results == {"policy_a": True, "policy_b": True}
+    assert policy_manager.ism_client.put_policy.call_count == 2
+
+
+def test_publish_policies_fetches_existing_once(policy_manager):
+    """Test that sequence numbers for all policies come from a single listing."""
+    policy_manager.ism_client.get_policy.return_value = {
+        "policies": [{"_id": "policy_a", "_seq_no": 3, "_primary_term": 1, "policy": {}}],
+        "total_policies": 1,
+    }
+    policy_content = {"default_state": "hot", "states": []}
+    for name in ("policy_a", "policy_b"):
+        with open(os.path.join(policy_manager.policies_dir, f"{name}.yaml"), "w") as f:
+            yaml.dump(policy_content, f)
+
+    results = policy_manager.publish_policies()
+
+    assert results == {"policy_a": True, "policy_b": True}
+    policy_manager.ism_client.get_policy.assert_called_once_with(
+        params={"size": POLICY_PAGE_SIZE, "from": 0}
+    )
+    policy_manager.ism_client.put_policy.assert_any_call(
+        policy="policy_a",
+        body={"policy": policy_content},
+        params={"if_seq_no": 3, "if_primary_term": 1},
+    )
+    policy_manager.ism_client.put_policy.assert_any_call(
+        policy="policy_b", body={"policy": policy_content}
+    )
+
+
+def test_publish_policies_pages_through_existing(policy_manager):
+    """Test that sequence numbers are fetched page by page when there are many policies."""
+    pages = [
+        {
+            "policies": [
+                {"_id": f"policy_{i}", "_seq_no": i, "_primary_term": 1, "policy": {}}
+                for i in range(start, stop)
+            ],
+            "total_policies": 3,
+        }
+        for start, stop in ((0, 2), (2, 3))
+    ]
+    policy_manager.ism_client.get_policy.side_effect = pages
+    for i in range(3):
+        with open(os.path.join(policy_manager.policies_dir, f"policy_{i}.yaml"), "w") as f:
+            yaml.dump({"default_state": "hot", "states": []}, f)
+
+    with patch("opensearch_keeper.ism_policy_manager.POLICY_PAGE_SIZE", 2):
+        results = policy_manager.publish_policies()
+
+    assert results == {"policy_0": True, "policy_1": True, "policy_2": True}
+    assert policy_manager.ism_client.get_policy.call_args_list == [
+        call(params={"size": 2, "from": 0}),
+        call(params={"size": 2, "from": 2}),
+    ]
+    policy_manager.ism_client.put_policy.assert_any_call(
+        policy="policy_2",
+        body={"policy": {"default_state": "hot", "states": []}},
+        params={"if_seq_no": 2, "if_primary_term": 1},
+    )
+
+
+def test_publish_policies_yml_and_dotted_names(policy_manager):
+    """Test that .yml files and policy names containing dots are published."""
+    policy_manager.ism_client.get_policy.side_effect = NotFoundError(404, "Not Found", {})
+    for filename in ("logs.v2.yml", "metrics.yaml", "notes.txt"):
+        with open(os.path.join(policy_manager.policies_dir, filename), "w") as f:
+            yaml.dump({"default_state": "hot", "states": []}, f)
+    os.mkdir(os.path.join(policy_manager.policies_dir, "nested.yaml"))
+
+    results = policy_manager.publish_policies()
+
+    assert results == {"logs.v2": True, "metrics": True}
+    assert sorted(policy_manager.list_local_policies_names()) == ["logs.v2", "metrics"]
+
+
+@pytest.mark.parametrize("listing_order", [("yml", "yaml"), ("yaml", "yml")])
+def test_scan_policy_files_prefers_yaml(policy_manager, listing_order, caplog):
+    """Test that .yaml files win over .yml files of the same name, whatever the listing order."""
+    entries = []
+    for extension in listing_order:
+        path = os.path.join(policy_manager.policies_dir, f"policy1.{extension}")
+        with open(path, "w") as f:
+            yaml.dump({"default_state": "hot", "states": []}, f)
+        entry = MagicMock(path=path)
+        entry.name = f"policy1.{extension}"
+        entries.append(entry)
+
+    with patch("opensearch_keeper.ism_policy_manager.os.scandir") as scandir:
+        scandir.return_value.__enter__.return_value = entries
+        policy_files = policy_manager._scan_policy_files()
+
+    assert policy_files == {"policy1": os.path.join(policy_manager.policies_dir, "policy1.yaml")}
+    assert "using policy1.yaml" in caplog.text
+
+
+def test_publish_policies_skips_unchanged(policy_manager):
+    """Test that policies matching the manifest are not published again."""
+    policies_dir = policy_manager.policies_dir
+    manifest_path = os.path.join(policies_dir, MANIFEST_FILENAME)
+    policy_manager.save_policies()
+    # The manifest is only created once unchanged policies are skipped
+    assert not os.path.exists(manifest_path)
+
+    policy_manager.ism_client.get_policy.side_effect = NotFoundError(404, "Not Found", {})
+    with open(os.path.join(policies_dir, "new.yaml"), "w") as f:
+        yaml.dump({"default_state": "warm", "states": []}, f)
+    everything = {"policy1": True, "policy2": True, "new": True}
+
+    with patch("opensearch_keeper.ism_policy_manager.os.replace", wraps=os.replace) as replace:
+        assert policy_manager.publish_policies(skip_unchanged=True) == everything
+    # The manifest is written once per batch
+    replace.assert_called_once()
+    assert policy_manager.publish_policies(skip_unchanged=True) == {}
+    assert policy_manager.list_local_policies_names(skip_unchanged=True) == []
+    assert policy_manager.publish_policies() == everything
+
+    with open(os.path.join(policies_dir, "policy1.yaml"), "a") as f:
+        f.write("description: edited locally\n")
+    assert policy_manager.list_local_policies_names(skip_unchanged=True) == ["policy1"]
+
+    # Saving records the contents of the saved files
+    policy_manager.ism_client.get_policy.side_effect = None
+    policy_manager.save_policies()
+    assert policy_manager.publish_policies(skip_unchanged=True) == {}
+
+    # Deleted policies are published again even if the file is unchanged
+    policy_manager.ism_client.get_policy.side_effect = NotFoundError(404, "Not Found", {})
+    policy_manager.delete_policy("new")
+    policy_manager.delete_policies(["policy2"])
+    assert policy_manager.publish_policies(skip_unchanged=True) == {"policy2": True, "new": True}
+
+    # Publishing outside publish_policies can be recorded as well
+    with open(os.path.join(policies_dir, "new.yaml"), "a") as f:
+        f.write("description: published by the CLI\n")
+    policy_manager.record_published_policies(["new"])
+    assert policy_manager.publish_policies(skip_unchanged=True) == {}
+
+
+def test_load_yaml_cached(tmp_path):
+    """Test that policy files are parsed again only after they change."""
+    policy_file = tmp_path / "policy.yaml"
+    policy_file.write_text("default_state: hot\n")
+
+    first = _load_yaml_cached(str(policy_file))
+    assert _load_yaml_cached(str(policy_file)) is first
+
+    policy_file.write_text("default_state: warm\n")
+    stat = os.stat(policy_file)
+    os.utime(policy_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert _load_yaml_cached(str(policy_file)) == {"default_state": "warm"}
+
+
+def test_strip_policy_metadata():
+    """Test removing server-maintained fields without modifying the input."""
+    policy = {
+        "policy_id": "policy1",
+        "schema_version": 21,
+        "last_updated_time": 1727172147906,
+        "default_state": "hot",
+        "ism_template": [{"index_patterns": ["logs-*"], "last_updated_time": 1727172147906}],
+    }
+
+    assert _strip_policy_metadata(policy) == {
+        "default_state": "hot",
+        "ism_template": [{"index_patterns": ["logs-*"]}],
+    }
+    assert policy["policy_id"] == "policy1"
+    assert "last_updated_time" in policy["ism_template"][0]
+
+
+def test_policy_diff():
+    """Test comparing policy definitions regardless of list order."""
+    remote = {
+        "description": "Old",
+        "default_state": "hot",
+        "states": [{"name": "hot", "actions": []}, {"name": "delete", "actions": []}],
+        "ism_template": [{"index_patterns": ["logs-*", "metrics-*"], "priority": 1}],
+    }
+    reordered = {
+        "description": "Old",
+        "default_state": "hot",
+        "states": [{"name": "delete", "actions": []}, {"name": "hot", "actions": []}],
+        "ism_template": [{"priority": 1, "index_patterns": ["metrics-*", "logs-*"]}],
+    }
+    assert _policy_diff(remote, reordered) is None
+
+    local = {
+        "default_state": "warm",
+        "states": [
+            {"name": "hot", "actions": [{"rollover": {}}]},
+            {"name": "delete", "actions": []},
+        ],
+        "ism_template": [{"index_patterns": ["logs-*"], "priority": 1}],
+        "error_notification": None,
+    }
+    assert _policy_diff(remote, local) == {
+        "added": {
+            "root['error_notification']": None,
+            "root['states'][0]['actions'][0]": {"rollover": {}},
+        },
+        "removed": {
+            "root['description']": "Old",
+            "root['ism_template'][0]['index_patterns'][1]": "metrics-*",
+        },
+        "changed": {"root['default_state']": ("hot", "warm")},
+    }
+    assert _policy_diff({"priority": 1}, {"priority": 1.0}) is not None
+
+
+def test_policy_diff_reordered_lists():
+    """Test that reordered lists report the items that differ, not every shifted position."""
+    remote = {"states": [{"name": "a"}, {"name": "b"}, {"name": "c"}, {"name": "d"}]}
+    local = {"states": [{"name": "b"}, {"name": "a"}, {"name": "e"}, {"name": "f"}]}
+    assert _policy_diff(remote, local) == {
+        "added": {"root['states'][2]": {"name": "e"}, "root['states'][3]": {"name": "f"}},
+        "removed": {"root['states'][2]": {"name": "c"}, "root['states'][3]": {"name": "d"}},
+        "changed": {},
+    }
+
+    replaced = {"states": [{"name": "b"}, {"name": "a"}, {"name": "c"}, {"name": "x"}]}
+    assert _policy_diff(remote, replaced)["changed"] == {"root['states'][3]['name']": ("d", "x")}
+
+    # YAML keys such as 1 or on load as int or bool, next to string keys
+    mixed = {"states": [{1: "one", "name": "a"}, {True: "on", "name": "b"}]}
+    assert _policy_diff(mixed, {"states": list(reversed(mixed["states"]))}) is None
+
+
+def test_diff_policy(policy_manager):
+    """Test diffing a local policy file against the policy in OpenSearch."""
+    policy_manager.ism_client.get_policy.return_value = {
+        "_seq_no": 4,
+        "_primary_term": 1,
+        "policy": {
+            "policy_id": "policy1",
+            "default_state": "hot",
+            "states": [],
+            "last_updated_time": 1727172147906,
+        },
+    }
+    policy_file = os.path.join(policy_manager.policies_dir, "policy1.yaml")
+    with open(policy_file, "w") as f:
+        yaml.dump({"default_state": "hot", "states": []}, f)
+    assert policy_manager.diff_policy("policy1") == {"has_changes": False}
+
+    with open(policy_file, "w") as f:
+        yaml.dump({"default_state": "warm", "states": []}, f)
+    result = policy_manager.diff_policy("policy1")
+    assert result["has_changes"] is True
+    assert result["diff"]["changed"] == {"root['default_state']": ("hot", "warm")}
+    assert (result["seq_no"], result["primary_term"]) == (4, 1)
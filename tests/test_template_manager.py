@@ -7,6 +7,7 @@ import tempfile
 import pytest
 from unittest.mock import MagicMock, patch
 
+from opensearchpy.exceptions import NotFoundError
 from opensearch_keeper.template_manager import TemplateManager
 
 
@@ -53,6 +54,16 @@ def template_manager(mock_opensearch):
         yield manager
 
 
+def test_create_client_skips_info_by_default(template_manager, mock_opensearch):
+    """Test that the connection is only tested when requested."""
+    mock_opensearch.return_value.info.assert_not_called()
+
+    TemplateManager(
+        template_manager.env_config, template_manager.templates_dir, [], verify_connection=True
+    )
+    mock_opensearch.return_value.info.assert_called_once_with()
+
+
 def test_list_templates(template_manager):
     """Test listing templates."""
     templates = template_manager.list_templates()
@@ -89,6 +100,36 @@ def test_save_templates(template_manager):
     assert "template2.yaml" in file_names
 
 
+def test_save_templates_keeps_key_order(template_manager):
+    """Test that saved templates keep the key order returned by OpenSearch."""
+    template = {"priority": 1, "index_patterns": ["logs-*"], "composed_of": []}
+    template_manager.client.indices.get_index_template.return_value = {
+        "index_templates": [{"name": "logs", "index_template": template}]
+    }
+
+    (file_path,) = template_manager.save_templates()
+
+    with open(file_path) as f:
+        content = f.read()
+    keys = [line.split(":")[0] for line in content.splitlines() if not line.startswith("-")]
+    assert keys == list(template)
+
+
+def test_save_templates_skips_failures(template_manager):
+    """Test that templates are saved concurrently and failed ones are left out."""
+    template_manager.client.indices.get_index_template.return_value = {
+        "index_templates": [
+            {"name": "template1", "index_template": {"index_patterns": ["pattern1*"]}},
+            {"name": "missing/template", "index_template": {"index_patterns": ["x*"]}},
+            {"name": "template2", "index_template": {"index_patterns": ["pattern2*"]}},
+        ]
+    }
+
+    saved_files = template_manager.save_templates(max_workers=2)
+
+    assert [os.path.basename(f) for f in saved_files] == ["template1.yaml", "template2.yaml"]
+
+
 def test_publish_template(template_manager):
     """Test publishing a template."""
     # Create a temporary template file with the new index template format
@@ -117,3 +158,90 @@ def test_delete_template(template_manager):
 
     # Verify that delete_template was called
     template_manager.client.indices.delete_index_template.assert_called_once_with(name="template1")
+
+
+def test_publish_templates(template_manager):
+    """Test publishing several templates concurrently."""
+    for name in ("template1", "template2", "template3"):
+        with open(os.path.join(template_manager.templates_dir, f"{name}.yaml"), "w") as f:
+            f.write("index_patterns: [test*]\n")
+    with open(os.path.join(template_manager.templates_dir, "broken.yaml"), "w") as f:
+        f.write("settings: {}\n")
+
+    results = template_manager.publish_templates("template*", max_workers=2)
+
+    assert results == {"template1": True, "template2": True, "template3": True}
+    assert template_manager.client.indices.put_index_template.call_count == 3
+
+
+def test_publish_templates_yml_and_dotted_names(template_manager):
+    """Test that .yml files and template names containing dots are published."""
+    for filename in ("logs.v2.yml", "metrics.yaml", "notes.txt", "yaml"):
+        with open(os.path.join(template_manager.templates_dir, filename), "w") as f:
+            f.write("index_patterns: [test*]\n")
+    os.mkdir(os.path.join(template_manager.templates_dir, "nested.yaml"))
+
+    results = template_manager.publish_templates()
+
+    assert results == {"logs.v2": True, "metrics": True}
+    template_manager.client.indices.put_index_template.assert_any_call(
+        name="logs.v2", body={"index_patterns": ["test*"]}
+    )
+
+
+@pytest.mark.parametrize("listing_order", [("yml", "yaml"), ("yaml", "yml")])
+def test_scan_template_files_prefers_yaml(template_manager, listing_order, caplog):
+    """Test that .yaml files win over .yml files of the same name, whatever the listing order."""
+    entries = []
+    for extension in listing_order:
+        path = os.path.join(template_manager.templates_dir, f"logs.{extension}")
+        with open(path, "w") as f:
+            f.write("index_patterns: [logs*]\n")
+        entry = MagicMock(path=path)
+        entry.name = f"logs.{extension}"
+        entries.append(entry)
+
+    with patch("opensearch_keeper.template_manager.os.scandir") as scandir:
+        scandir.return_value.__enter__.return_value = entries
+        template_files = template_manager._scan_template_files()
+
+    assert template_files == {"logs": os.path.join(template_manager.templates_dir, "logs.yaml")}
+    assert "using logs.yaml" in caplog.text
+
+
+def test_list_templates_reuses_recent_listing(template_manager):
+    """Test that listings are cached briefly and invalidated by changes."""
+    get_index_template = template_manager.client.indices.get_index_template
+
+    template_manager.list_templates()
+    template_manager.list_templates("template1")
+    assert get_index_template.call_count == 1
+
+    template_manager.delete_template("template1")
+    template_manager.list_templates()
+    assert get_index_template.call_count == 2
+
+    with patch("opensearch_keeper.template_manager.time.monotonic", return_value=1e9):
+        template_manager.list_templates()
+    assert get_index_template.call_count == 3
+
+
+def test_list_templates_filters_server_side(template_manager):
+    """Test that simple wildcard patterns are passed to OpenSearch."""
+    get_index_template = template_manager.client.indices.get_index_template
+
+    templates = template_manager.list_templates("template1*")
+    get_index_template.assert_called_once_with(name="template1*")
+    assert [t["name"] for t in templates] == ["template1"]
+
+    template_manager.list_templates("template?")
+    get_index_template.assert_called_with(name="*")
+
+    # A leading '-' would be an exclusion in OpenSearch, but is a literal character in fnmatch
+    template_manager._templates_cache = None
+    assert template_manager.list_templates("-template*") == []
+    get_index_template.assert_called_with(name="*")
+
+    template_manager._templates_cache = None
+    get_index_template.side_effect = NotFoundError(404, "Not Found", {})
+    assert template_manager.list_templates("missing") == []
@@ -0,0 +1,99 @@
+"""
+Tests for the utility functions.
+"""
+
+import io
+import json
+import sys
+
+import yaml
+
+from opensearch_keeper.utils import (
+    compile_patterns,
+    format_policy_diff,
+    format_policy_list,
+    format_template_list,
+    format_timestamp,
+    get_json_dumps,
+    get_yaml_classes,
+    write_template_list,
+)
+
+
+def test_format_template_list():
+    """Test formatting templates in every output format."""
+    templates = [{"name": "template1"}, {"name": "template2"}]
+
+    assert format_template_list(templates) == "Templates:\n- template1\n- template2\n"
+    assert json.loads(format_template_list(templates, "json")) == ["template1", "template2"]
+    assert yaml.safe_load(format_template_list(templates, "yaml")) == ["template1", "template2"]
+    assert format_template_list([]) == "No templates found.\n"
+
+
+def test_format_policy_list():
+    """Test formatting ISM policies."""
+    assert format_policy_list([{"name": "policy1"}]) == "ISM Policies:\n- policy1\n"
+    assert format_policy_list([]) == "No ISM policies found.\n"
+
+
+def test_write_template_list_streams():
+    """Test writing templates directly to a stream."""
+    out = io.StringIO()
+    write_template_list([{"name": "template1"}], out, "json")
+    assert out.getvalue() == '[\n  "template1"\n]\n'
+
+
+def test_format_template_list_json_keeps_non_ascii():
+    """Test that non-ASCII template names are written unescaped."""
+    assert format_template_list([{"name": "modèle"}], "json") == '[\n  "modèle"\n]\n'
+
+
+def test_get_json_dumps_falls_back_without_orjson(monkeypatch):
+    """Test that the stdlib json module is used when orjson is unavailable."""
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    get_json_dumps.cache_clear()
+    try:
+        assert get_json_dumps()(["modèle"]) == '[\n  "modèle"\n]'
+    finally:
+        get_json_dumps.cache_clear()
+
+
+def test_format_timestamp():
+    """Test formatting unix timestamps as UTC strings."""
+    assert format_timestamp(0) == "1970-01-01 00:00:00"
+    assert format_timestamp(1727172147) == "2024-09-24 10:02:27"
+
+
+def test_compile_patterns():
+    """Test compiling several wildcard patterns into one regex."""
+    regex = compile_patterns([".kibana*", "ss4o_?", ".opendistro_security"])
+    assert regex.match(".kibana_1")
+    assert regex.match("ss4o_x")
+    assert regex.match(".opendistro_security")
+    assert not regex.match("ss4o_xy")
+    assert not regex.match("my.kibana")
+    assert compile_patterns([]) is None
+
+
+def test_format_policy_diff():
+    """Test formatting policy differences one per line."""
+    diff = {
+        "added": {"root['description']": "new"},
+        "removed": {"root['ism_template']": []},
+        "changed": {"root['default_state']": ("hot", "warm")},
+    }
+    assert format_policy_diff(diff).splitlines() == [
+        "Item root['description'] added with value 'new'.",
+        "Item root['ism_template'] removed, was [].",
+        "Value of root['default_state'] changed from 'hot' to 'warm'.",
+    ]
+
+
+def test_get_yaml_classes():
+    """Test that the YAML classes are safe and prefer libyaml when available."""
+    yaml_loader, yaml_dumper = get_yaml_classes()
+    assert yaml_loader is getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    assert yaml_dumper is getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+    data = {"index_patterns": ["logs-*"], "priority": 1}
+    assert yaml.load(yaml.dump(data, Dumper=yaml_dumper), Loader=yaml_loader) == data